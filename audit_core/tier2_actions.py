@@ -104,12 +104,17 @@ def detect_phases(context, events):
     debug(context, "[PHASES] ---- Phase detection start (v17.9) ----")
 
     # --- Validate input ----------------------------------------------------
-    if not events or not isinstance(events, (list, tuple)):
+    if isinstance(events, pd.DataFrame):
+        # DataFrame input: project the needed columns, no per-row dicts
+        cols = [c for c in ("start_date_local", "start_date", "icu_training_load") if c in events.columns]
+        df = events[cols].copy()
+    elif not events or not isinstance(events, (list, tuple)):
         debug(context, "[PHASES] ❌ No valid event list")
         context["phases"] = [{"phase": "No Data", "start": None, "end": None, "delta": 0.0}]
         return context
+    else:
+        df = pd.DataFrame(events)
 
-    df = pd.DataFrame(events)
     if df.empty or "icu_training_load" not in df.columns:
         debug(context, "[PHASES] ❌ Missing icu_training_load")
         context["phases"] = [{"phase": "No Data", "start": None, "end": None, "delta": 0.0}]
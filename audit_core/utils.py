@@ -63,6 +63,11 @@ def debug(*args):
 
 
 
+def debug_enabled(context) -> bool:
+    """True when verbose diagnostics were requested (debug_mode / --diag)."""
+    return isinstance(context, dict) and bool(context.get("debug_mode") or context.get("diag"))
+
+
 def validate_dataset_integrity(df: pd.DataFrame) -> bool:
     """Basic dataset sanity check — ensures no NaNs in critical fields."""
     required = ["moving_time", "icu_training_load"]
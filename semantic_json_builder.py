@@ -28,23 +28,52 @@ Includes (URF v5.1 Canonical Layout):
 """
 
 
-import json, math
+import json, re
 from datetime import datetime, date, timezone
 import pandas as pd
-from math import isnan
 from coaching_cheat_sheet import CHEAT_SHEET
-from coaching_profile import COACH_PROFILE, REPORT_HEADERS, REPORT_RESOLUTION, REPORT_CONTRACT
-from audit_core.utils import debug
+from coaching_profile import COACH_PROFILE, REPORT_HEADERS, REPORT_RESOLUTION, REPORT_CONTRACT, RENDERER_PROFILES
+from audit_core.utils import debug, debug_enabled
 import numpy as np
-from math import isnan
-import pytz
+from zoneinfo import ZoneInfo
 from audit_core.tier2_derived_metrics import classify_marker
+from audit_core.tier2_actions import detect_phases
 from textwrap import dedent
+from functools import lru_cache
+from collections.abc import Iterator
+
+# CHEAT_SHEET is static — bind hot sub-dicts once at import
+_THRESHOLDS = CHEAT_SHEET.get("thresholds", {})
+_PHASE_THRESHOLDS = CHEAT_SHEET.get("phase_thresholds", {})
+_CONTEXT = CHEAT_SHEET.get("context", {})
+_LINKS = CHEAT_SHEET.get("coaching_links", {})
+_DISPLAY = CHEAT_SHEET.get("display_names", {})
+_MARKERS = COACH_PROFILE.get("markers", {})
+
+# (green_lo, green_hi, amber_lo, amber_hi) for metrics defining both bands
+_BOUNDS = {
+    name: (g[0], g[1], a[0], a[1])
+    for name, t in _THRESHOLDS.items()
+    if isinstance(t, dict) and (g := t.get("green")) and (a := t.get("amber"))
+}
 
 # ---------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------
 
+@lru_cache(maxsize=32)
+def _tz(name: str | None) -> ZoneInfo:
+    """IANA zone lookup, cached per name (falls back to UTC)."""
+    return ZoneInfo(name or "UTC")
+
+
+@lru_cache(maxsize=None)
+def _future_forecast_runner():
+    """Tier-3 forecaster, imported once on first use (pulls in the HTTP stack)."""
+    from audit_core.tier3_future_forecast import run_future_forecast
+    return run_future_forecast
+
+
 def resolve_metric_confidence(metric_key, context, cheat_sheet):
     rules = cheat_sheet.get("metric_confidence", {}).get(metric_key)
     if not rules:
@@ -77,44 +106,83 @@ def handle_missing_data(value, default_value=None):
     """Convert NaN or None → safe default."""
     if value is None:
         return default_value
-    if isinstance(value, float) and isnan(value):
+    # Float guard first: other types (pd.NA, arrays, Series) pass through untouched
+    if isinstance(value, float) and value != value:  # NaN is the only float != itself
         return default_value
     return value
 
 
+def _first(*vals):
+    """First value that is neither None nor NaN (fallback chains)."""
+    for v in vals:
+        if v is not None and v == v:  # not NaN
+            return v
+    return None
+
+
 def convert_to_str(value):
     """Convert datetime/Timestamp/date → ISO string."""
-    if isinstance(value, datetime):
-        return value.isoformat()
-    if isinstance(value, pd.Timestamp):
-        return value.isoformat()
+    # pd.Timestamp ⊂ datetime ⊂ date → one check covers all three
     if isinstance(value, date):
         return value.isoformat()
     return value
 
 
+@lru_cache(maxsize=256)
+def _metric_semantics(metric_name):
+    """
+    Static part of a metric envelope — cheat-sheet + coach-profile lookups.
+    Depends only on the metric name, so it is resolved once per metric:
+    (thresholds, phase_thresholds, profile_desc, interpretation,
+     coaching_link, display_name)
+    """
+    profile_desc = _MARKERS.get(metric_name, {})
+    return (
+        _THRESHOLDS.get(metric_name, {}),
+        _PHASE_THRESHOLDS.get(metric_name, {}),
+        profile_desc,
+        _CONTEXT.get(metric_name) or profile_desc.get("interpretation"),
+        _LINKS.get(metric_name) or profile_desc.get("coaching_implication"),
+        _DISPLAY.get(metric_name, metric_name),
+    )
+
+
+@lru_cache(maxsize=512)
+def _classify_metric_value(metric_name, v, phase):
+    """Traffic-light classification for a numeric value (memoised per name/value/phase)."""
+    thresholds, phase_thresholds = _metric_semantics(metric_name)[:2]
+
+    # Phase-specific bands override the base ones when defined
+    active_thresholds = phase_thresholds.get(phase) or thresholds
+
+    # Base bands: unpack the precompiled tuple, no per-call dict hits
+    if active_thresholds is thresholds:
+        bounds = _BOUNDS.get(metric_name)
+        if bounds:
+            lg, hg, la, ha = bounds
+            return "green" if lg <= v <= hg else ("amber" if la <= v <= ha else "red")
+
+    green = active_thresholds.get("green")
+    amber = active_thresholds.get("amber")
+
+    if green and green[0] <= v <= green[1]:
+        return "green"
+    if amber and amber[0] <= v <= amber[1]:
+        return "amber"
+    return "red"
+
+
 def semantic_block_for_metric(name, value, context):
     """
     Builds semantic envelope for a single metric.
     100% data-driven: thresholds, phase overrides, and interpretations
     are all defined in coaching_cheat_sheet.py.
     """
-    import math
-
     metric_name = str(name).strip()
-    thresholds = CHEAT_SHEET["thresholds"].get(metric_name, {})
-    phase_thresholds = CHEAT_SHEET.get("phase_thresholds", {}).get(metric_name, {})
-    profile_desc = COACH_PROFILE["markers"].get(metric_name, {})
-
-    interpretation = (
-        CHEAT_SHEET["context"].get(metric_name)
-        or profile_desc.get("interpretation")
-    )
-    coaching_link = (
-        CHEAT_SHEET["coaching_links"].get(metric_name)
-        or profile_desc.get("coaching_implication")
-    )
-    display_name = CHEAT_SHEET.get("display_names", {}).get(metric_name, metric_name)
+    (
+        thresholds, _, profile_desc,
+        interpretation, coaching_link, display_name,
+    ) = _metric_semantics(metric_name)
 
     phase = (
         context.get("current_phase")
@@ -122,33 +190,22 @@ def semantic_block_for_metric(name, value, context):
         or ""
     ).lower()
 
-    classification = "unknown"
-
-    try:
-        if value is None or (isinstance(value, (float, int)) and math.isnan(value)):
-            classification = "undefined"
-        else:
+    # Explicit type guards — no exception-driven control flow
+    if value is None:
+        classification = "undefined"
+    elif isinstance(value, (int, float, np.number)):
+        classification = (
+            "undefined" if value != value  # NaN check
+            else _classify_metric_value(metric_name, float(value), phase)
+        )
+    else:
+        # Numeric strings (e.g. "0.82") still classify; anything else is unknown
+        try:
             v = float(value)
-
-            # Pull the correct thresholds dynamically
-            active_thresholds = (
-                phase_thresholds.get(phase)
-                if metric_name in phase_thresholds and phase in phase_thresholds
-                else thresholds
-            )
-
-            green = active_thresholds.get("green")
-            amber = active_thresholds.get("amber")
-
-            if green and green[0] <= v <= green[1]:
-                classification = "green"
-            elif amber and amber[0] <= v <= amber[1]:
-                classification = "amber"
-            else:
-                classification = "red"
-
-    except Exception:
-        classification = "unknown"
+        except (TypeError, ValueError):
+            classification = "unknown"
+        else:
+            classification = _classify_metric_value(metric_name, v, phase)
 
     return {
         "name": metric_name,
@@ -156,7 +213,7 @@ def semantic_block_for_metric(name, value, context):
         "value": convert_to_str(value),
         "framework": profile_desc.get("framework") or "Unknown",
         "formula": profile_desc.get("formula"),
-        "thresholds": thresholds,
+        "thresholds": dict(thresholds),  # own copy — the cached dict is shared across reports
         "phase_context": phase,
         "classification": classification,
         "metric_confidence": resolve_metric_confidence(metric_name, context, CHEAT_SHEET),
@@ -169,16 +226,22 @@ def semantic_block_for_metric(name, value, context):
 # 🔬 Zone semantics helpers (CHEAT_SHEET–driven)
 # ---------------------------------------------------------
 zone_semantics = CHEAT_SHEET.get("zone_semantics", {})
+_ZONE_META = {k: (v.get("label"), v.get("description")) for k, v in zone_semantics.items()}
 
 def zone_block(key, dist, thresholds):
-    meta = zone_semantics.get(key, {})
+    label, description = _ZONE_META.get(key, (None, None))
     return {
-        "label": meta.get("label"),
-        "description": meta.get("description"),
+        "label": label,
+        "description": description,
         "distribution": dist or {},
         "thresholds": thresholds or [],
     }
 
+_SS_RENAMES = {"z8": "SS", "_fused_power_z8": "_fused_power_SS"}
+
+# Fields projected from detected phases into semantic["phases"]
+_PHASE_KEYS = ("phase", "start", "end", "duration_days", "duration_weeks")
+
 def rename_z8_to_ss(dist: dict):
     """
     Semantic-only rename for Sweet Spot (power only).
@@ -192,20 +255,40 @@ def rename_z8_to_ss(dist: dict):
     if not isinstance(dist, dict):
         return dist
 
-    out = {}
-    for k, v in dist.items():
-        # --- Power Sweet Spot (canonical) ---
-        if k == "z8":
-            out["SS"] = v
+    # Fast path: nothing to rename → hand back as-is, no copy
+    if "z8" not in dist and "_fused_power_z8" not in dist:
+        return dist
 
-        # --- Fused Power Sweet Spot ---
-        elif k == "_fused_power_z8":
-            out["_fused_power_SS"] = v
+    # Rebuild only when a key changes (keeps original key order)
+    return {_SS_RENAMES.get(k, k): v for k, v in dist.items()}
 
-        else:
-            out[k] = v
+def _zone_or_empty(key, dist, thresholds):
+    """zone_block with the Sweet Spot rename, skipped for empty families."""
+    if not dist and not thresholds:
+        label, description = _ZONE_META.get(key, (None, None))
+        return {"label": label, "description": description, "distribution": {}, "thresholds": []}
+    return zone_block(key, rename_z8_to_ss(dist), thresholds)
+
+# Planned-event values treated as empty (NaN is checked separately)
+_BLANK_VALUES = (None, "", [], {})
+
+# Calendar fields copied verbatim onto planned events (after the derived ones)
+_PLANNED_PASSTHROUGH = (
+    "load_target", "time_target", "distance_target", "strain_score",
+    "plan_name", "plan_workout_id", "color", "tags",
+)
+
+
+@lru_cache(maxsize=512)
+def _weekday_name(iso_date: str) -> str:
+    """Weekday name for a YYYY-MM-DD string (cached — calendars repeat days)."""
+    return datetime.fromisoformat(iso_date).strftime("%A")
+
+
+def _is_blank(v) -> bool:
+    """True for planned-event values that carry nothing (None, "", [], {}, NaN)."""
+    return v in _BLANK_VALUES or (isinstance(v, float) and v != v)
 
-    return out
 
 def resolve_planned_duration_minutes(e: dict):
     """
@@ -223,8 +306,8 @@ def resolve_planned_duration_minutes(e: dict):
 
     try:
         if e.get("start_date_local") and e.get("end_date_local"):
-            start = pd.to_datetime(e["start_date_local"])
-            end = pd.to_datetime(e["end_date_local"])
+            start = pd.to_datetime(e["start_date_local"], format="ISO8601")
+            end = pd.to_datetime(e["end_date_local"], format="ISO8601")
             return round((end - start).total_seconds() / 60, 1)
     except Exception:
         pass
@@ -236,6 +319,14 @@ def resolve_planned_duration_minutes(e: dict):
 # Insights Builder
 # ---------------------------------------------------------
 
+# HRV 7-day trend: x = 0..6 centred on its mean, so slope = x·y / Σx²
+_HRV_TREND_X = np.arange(7, dtype=np.float64) - 3.0
+_HRV_TREND_DENOM = float((_HRV_TREND_X ** 2).sum())
+
+# Shared read-only fallback for chained .get() lookups
+_EMPTY = {}
+
+
 def build_insights(semantic):
     """
     Build high-level coaching insights using canonical thresholds
@@ -244,6 +335,11 @@ def build_insights(semantic):
     insights = {}
     report_type = semantic.get("meta", {}).get("report_type", "weekly")
 
+    # Bind the source sections once; _EMPTY stands in for missing entries
+    extended = semantic.get("extended_metrics") or _EMPTY
+    metrics = semantic.get("metrics") or _EMPTY
+    wellness = semantic.get("wellness") or _EMPTY
+
     # 🧠 Adaptive window duration by report type
     window_map = {
         "weekly": "7d",
@@ -258,14 +354,8 @@ def build_insights(semantic):
 
 
     # --- Fatigue Trend ---
-    atl = (
-        semantic.get("extended_metrics", {}).get("ATL", {}).get("value")
-        or semantic.get("wellness", {}).get("ATL")
-    )
-    ctl = (
-        semantic.get("extended_metrics", {}).get("CTL", {}).get("value")
-        or semantic.get("wellness", {}).get("CTL")
-    )
+    atl = _first(extended.get("ATL", _EMPTY).get("value"), wellness.get("ATL"))
+    ctl = _first(extended.get("CTL", _EMPTY).get("value"), wellness.get("CTL"))
     ft = None
     if isinstance(atl, (int, float)) and isinstance(ctl, (int, float)) and ctl > 0:
         ft = round(((atl - ctl) / ctl) * 100, 1)
@@ -282,7 +372,7 @@ def build_insights(semantic):
     }
 
     # --- Metabolic Drift (FOxI proxy) ---
-    foxi = semantic.get("metrics", {}).get("FOxI", {}).get("value")
+    foxi = metrics.get("FOxI", _EMPTY).get("value")
     drift = None
     if isinstance(foxi, (int, float)):
         drift = round((70 - foxi) / 70, 3)
@@ -297,7 +387,7 @@ def build_insights(semantic):
     }
 
     # --- Fitness Phase (ACWR classification) ---
-    acwr_val = semantic.get("metrics", {}).get("ACWR", {}).get("value")
+    acwr_val = metrics.get("ACWR", _EMPTY).get("value")
     acwr_block = semantic_block_for_metric("ACWR", acwr_val, semantic)
     insights["fitness_phase"] = {
         "phase": acwr_block.get("classification"),
@@ -310,7 +400,7 @@ def build_insights(semantic):
     # ======================================================
     # 🔬 Adaptation Metrics (Fatigue Resistance, Efficiency)
     # ======================================================
-    adaptation = semantic.get("adaptation_metrics", {})
+    adaptation = semantic.get("adaptation_metrics") or _EMPTY
 
     # --- Fatigue Resistance ---
     if "Fatigue Resistance" in adaptation:
@@ -342,14 +432,12 @@ def build_insights(semantic):
     # 🌿 WELLNESS INSIGHTS (Coach-Profile & Cheat-Sheet Aligned)
     # ======================================================
     if report_type == "wellness":
-        wellness = semantic.get("wellness", {})
-
         # Ensure TSB available for recovery_index
-        tsb = (
-            wellness.get("tsb")
-            or wellness.get("TSB")
-            or semantic.get("wellness_summary", {}).get("tsb")
-            or 0
+        tsb = _first(
+            wellness.get("tsb"),
+            wellness.get("TSB"),
+            semantic.get("wellness_summary", _EMPTY).get("tsb"),
+            0,
         )
 
         # --- HRV Advanced Insights ---
@@ -373,13 +461,16 @@ def build_insights(semantic):
 
             # 2️⃣ Stability Index (1 - rolling std / mean)
             if hrv_series and len(hrv_series) >= 7:
-                import pandas as pd, numpy as np
-                df_hrv = pd.DataFrame(hrv_series)
-                df_hrv["hrv"] = pd.to_numeric(df_hrv["hrv"], errors="coerce")
-                recent = df_hrv.tail(14)["hrv"].dropna()
-                if len(recent) >= 5:
+                recent = np.fromiter(
+                    (
+                        v for v in (h.get("hrv") for h in hrv_series[-14:])
+                        if isinstance(v, (int, float)) and v == v
+                    ),
+                    dtype=np.float64,
+                )
+                if recent.size >= 5:
                     mean_val = recent.mean()
-                    std_val = recent.std()
+                    std_val = recent.std(ddof=1)  # sample std, as pandas
                     stability = round((1 - (std_val / mean_val)), 3)
                     stab_block = semantic_block_for_metric("HRVStability", stability, semantic)
                     insights["hrv_stability_index"] = {
@@ -393,11 +484,10 @@ def build_insights(semantic):
 
             # 3️⃣ Trend (slope of last 7 days)
             if hrv_series and len(hrv_series) >= 7:
-                import numpy as np
                 vals = [h.get("hrv") for h in hrv_series[-7:] if h.get("hrv")]
                 if len(vals) == 7:
-                    x = np.arange(7)
-                    slope = round(np.polyfit(x, vals, 1)[0], 2)
+                    # Closed-form OLS slope on the fixed, centred 7-day design
+                    slope = round(float(_HRV_TREND_X @ np.asarray(vals, dtype=np.float64)) / _HRV_TREND_DENOM, 2)
                     trend_block = semantic_block_for_metric("HRVTrend", slope, semantic)
                     insights["hrv_trend_7d"] = {
                         "value": slope,
@@ -453,6 +543,123 @@ def build_insights(semantic):
 
 
 
+# Context window annotated on each metric block (unknown → "unknown")
+_METRIC_WINDOWS = {
+    # Short-term / 7-day metrics
+    "Polarisation": "7d",
+    "PolarisationIndex": "7d",
+    "FatOxEfficiency": "7d",
+    "FOxI": "7d",
+    "MES": "7d",
+    "CUR": "7d",
+    "GR": "7d",
+    "RecoveryIndex": "7d",
+    "StressTolerance": "7d",
+    "ZQI": "7d",
+
+    # Long-term / 90-day metrics
+    "CTL": "90d",
+    "ATL": "90d",
+    "TSB": "90d",
+    "RampRate": "90d",
+    "FatigueTrend": "90d",
+    "AerobicDecay": "90d",
+    "Durability": "90d",
+
+    # Rolling or composite metrics
+    "ACWR": "rolling",
+    "Monotony": "rolling",
+    "Strain": "rolling",
+}
+
+
+# W′ balance inputs (array extraction order); presence is probed per name
+# against the columns' hash index instead of building set(df.columns)
+_WBAL_COLS = ("icu_pm_w_prime", "icu_max_wbal_depletion", "icu_joules_above_ftp")
+_WBAL_COLS_DATED = ("start_date_local",) + _WBAL_COLS
+
+
+# ---------------------------------------------------------
+# 🗂️ Reference dataset resolution
+# ---------------------------------------------------------
+# Priority per purpose: (context key, minimum rows, accepted kind).
+# "frame" keys count only when they hold a DataFrame, "records" keys only
+# when they hold a list (converted by the caller) — upstream may store
+# either type under the activities_* keys.
+_SEASON_SOURCES = (
+    ("_df_scope_full", 1, "frame"), ("activities_full", 1, "records"),
+    ("df_light", 1, "frame"), ("activities_light", 1, "records"),
+)
+_DF_REF_SOURCES = {
+    "season": _SEASON_SOURCES,
+    "summary": _SEASON_SOURCES,
+    "wellness": (("df_wellness", 1, "frame"), ("wellness", 1, "records")),
+}
+_DEFAULT_DF_REF_SOURCES = (("df_master", 1, "frame"), ("activities_full", 1, "records"))
+# season/summary totals: prefer long frames over a short scoped window
+_TOTALS_DF_REF_SOURCES = (
+    ("df_light", 101, "frame"), ("activities_light", 1, "records"), ("_df_scope_full", 101, "frame"),
+)
+
+
+# Optional sections per report type. Daily wellness rows are wellness-only;
+# season skips HRV and subjective markers (its contract drops the wellness
+# block and HRV insights are wellness-only) but keeps events, which feed
+# performance_summary. Other report types build the default set.
+_DEFAULT_FEATURES = frozenset({"hrv", "subjective", "events"})
+_REPORT_FEATURES = {
+    "season": frozenset({"events"}),
+    "wellness": _DEFAULT_FEATURES | {"daily"},
+}
+
+
+def resolve_df_ref(context, sources, to_frame=pd.DataFrame):
+    """
+    First dataset in `sources` holding at least its minimum rows.
+    Returns (df_ref, source_key) or (None, None).
+    """
+    for key, min_rows, kind in sources:
+        value = context.get(key)
+        if kind == "frame":
+            if isinstance(value, pd.DataFrame) and len(value) >= min_rows:
+                return value, key
+        elif isinstance(value, list) and len(value) >= min_rows:
+            return to_frame(key), key
+    return None, None
+
+
+def _phase_runs(phases):
+    """
+    Contiguous phase runs over week-ordered phase labels.
+    Unclassified weeks inherit the preceding phase (forward-fill of row
+    indices); a new run starts wherever the effective phase changes.
+    A missing phase (None/NaN) never equals another, so each such week
+    is its own run. Phases are compared as categorical int codes.
+    Returns (new_run mask per week, phase per run — None where missing).
+    """
+    phase_cat = pd.Categorical(phases)
+    codes = phase_cat.codes
+    if not len(codes):
+        return np.zeros(0, dtype=bool), []
+
+    labels = phase_cat.categories
+    inherit = (
+        codes == labels.get_loc("Unclassified")
+        if "Unclassified" in labels
+        else np.zeros(len(codes), dtype=bool)
+    )
+    inherit[0] = False
+    src = np.where(inherit, 0, np.arange(len(codes)))
+    effective = codes[np.maximum.accumulate(src)]
+
+    # Categorical code -1 marks a missing phase — decode it explicitly
+    missing = effective == -1
+    new_run = np.r_[True, effective[1:] != effective[:-1]] | missing
+    names = labels.tolist()
+    run_phases = [None if c < 0 else names[c] for c in effective[new_run].tolist()]
+    return new_run, run_phases
+
+
 # ---------------------------------------------------------
 # MAIN BUILDER
 # ---------------------------------------------------------
@@ -497,16 +704,31 @@ def build_semantic_json(context):
     # 🧭 Phase Detection (Base → Build → Peak → Taper → Recovery)
     # ------------------------------------------------------------------
     try:
-        from audit_core.tier2_actions import detect_phases
         if not context.get("phases"):
-            events = context.get("activities_full") or context.get("df_events") or []
-            if isinstance(events, pd.DataFrame):
-                events = events.to_dict(orient="records")
+            # detect_phases takes DataFrames directly — no to_dict("records")
+            events = context.get("activities_full")
+            if events is None or len(events) == 0:
+                events = context.get("df_events")
+            if events is None:
+                events = []
             context = detect_phases(context, events)
             debug(context, f"[SEMANTIC] Injected detected phases → {len(context.get('phases', []))}")
     except Exception as e:
         debug(context, f"[SEMANTIC] ⚠️ Phase detection failed: {e}")
 
+    # ---------------------------------------------------------
+    # DAILY LOAD (column-wise — records built by pandas, not per row)
+    # ---------------------------------------------------------
+    df_daily = context.get("df_daily")
+    daily_load = []
+    if isinstance(df_daily, pd.DataFrame) and not df_daily.empty:
+        daily_load = (
+            df_daily[["date", "icu_training_load"]]
+            .rename(columns={"icu_training_load": "tss"})
+            .astype({"tss": float})
+            .to_dict(orient="records")
+        )
+
     # ---------------------------------------------------------
     # BASE SEMANTIC STRUCTURE
     # ---------------------------------------------------------
@@ -528,10 +750,7 @@ def build_semantic_json(context):
             # --- Generation context ---
             "generated_at": {
                 "local": (
-                    datetime.now(
-                        pytz.timezone(context.get("timezone", "UTC"))
-                        if context.get("timezone") else pytz.UTC
-                    )
+                    datetime.now(_tz(context.get("timezone")))
                     .replace(microsecond=0)
                     .isoformat()
                 )
@@ -561,27 +780,27 @@ def build_semantic_json(context):
         # 🔬 Zones — Power, HR, Pace, Swim + Calibration
         # ---------------------------------------------------------
         "zones": {
-            "power": zone_block(
+            "power": _zone_or_empty(
                 "power",
-                rename_z8_to_ss(context.get("zone_dist_power")),
+                context.get("zone_dist_power"),
                 #context.get("zone_dist_power"),  
                 context.get("icu_power_zones") or context.get("athlete_power_zones"),
             ),
-            "hr": zone_block(
+            "hr": _zone_or_empty(
                 "hr",
-                rename_z8_to_ss(context.get("zone_dist_hr")),
+                context.get("zone_dist_hr"),
                 #context.get("zone_dist_hr"),
                 context.get("icu_hr_zones") or context.get("athlete_hr_zones"),
             ),
-            "pace": zone_block(
+            "pace": _zone_or_empty(
                 "pace",
-                rename_z8_to_ss(context.get("zone_dist_pace")),
+                context.get("zone_dist_pace"),
                 #context.get("zone_dist_pace"),
                 context.get("icu_pace_zones") or context.get("athlete_pace_zones"),
             ),
-            "swim": zone_block(
+            "swim": _zone_or_empty(
                 "swim",
-                rename_z8_to_ss(context.get("zone_dist_swim")),
+                context.get("zone_dist_swim"),
                 #context.get("zone_dist_swim"),
                 context.get("icu_swim_zones") or context.get("athlete_swim_zones"),
             ),
@@ -597,10 +816,7 @@ def build_semantic_json(context):
         # ---------------------------------------------------------
         # DAILY LOAD
         # ---------------------------------------------------------
-        "daily_load": [
-            {"date": row["date"], "tss": float(row["icu_training_load"])}
-            for _, row in getattr(context.get("df_daily"), "iterrows", lambda: [])()
-        ] if context.get("df_daily") is not None else [],
+        "daily_load": daily_load,
 
         "events": [],
         #PHASE BASED APPROACH
@@ -608,13 +824,7 @@ def build_semantic_json(context):
         #Seiler (2019) — mesocycle-level trend and micro-level workload separation.
         #Mujika & Padilla (2003) — tapering and recovery phases as distinct block summaries.
         "phases": [
-            {
-                "phase": p.get("phase"),
-                "start": p.get("start"),
-                "end": p.get("end"),
-                "duration_days": p.get("duration_days"),
-                "duration_weeks": p.get("duration_weeks"),
-            }
+            {k: p.get(k) for k in _PHASE_KEYS}
             for p in context.get("phases", [])
         ],
     }
@@ -673,96 +883,89 @@ def build_semantic_json(context):
     # ---------------------------------------------------------
     # 🧭 Polarisation Variants (Tier-2 authoritative values only)
     # ---------------------------------------------------------
-    try:
-        polarisation_variants = {}
-        cs = CHEAT_SHEET  # alias for brevity
-
-        def build_variant(metric_key: str, value: float, basis: str, source: str):
-            """
-            Universal polarisation variant builder.
-            Purely interpretative — no math. Uses Tier-2 values.
-            """
-            block = semantic_block_for_metric(metric_key, value, context)
-            block["metric_confidence"] = resolve_metric_confidence(
-                metric_key,
-                context,
-                CHEAT_SHEET
-            )
+    pi_fused = context.get("Polarisation_fused") or context.get("Polarisation")
+    pi_combined = context.get("Polarisation_combined") or context.get("PolarisationIndex")
 
-            # canonical enrichment — merge with COACH_PROFILE definitions
-            profile_def = COACH_PROFILE["markers"].get(metric_key, {})
-
-            block.update({
-                "display_name": cs["display_names"].get(metric_key, metric_key),
-                "basis": basis,
-                "source": source,
-                "framework": profile_def.get("framework", "Physiological"),
-                "formula": profile_def.get("formula"),
-                "thresholds": (
-                    cs["thresholds"].get(metric_key)
-                    or profile_def.get("criteria")
-                ),
-                "interpretation": (
-                    cs["context"].get(metric_key)
-                    or profile_def.get("interpretation")
-                ),
-                "coaching_implication": (
-                    cs["coaching_links"].get(metric_key)
-                    or profile_def.get("coaching_implication")
-                ),
-                "related_metrics": profile_def.get("criteria", {}),
-            })
+    if pi_fused is None and pi_combined is None:
+        debug(context, "[SEMANTIC] ⚠️ No valid Polarisation variants found in context")
+    else:
+        try:
+            polarisation_variants = {}
+
+            def build_variant(metric_key: str, value: float, basis: str, source: str):
+                """
+                Universal polarisation variant builder.
+                Purely interpretative — no math. Uses Tier-2 values.
+                """
+                # metric_confidence is already resolved by semantic_block_for_metric
+                block = semantic_block_for_metric(metric_key, value, context)
+
+                # canonical enrichment — merge with COACH_PROFILE definitions
+                profile_def = _MARKERS.get(metric_key, {})
+
+                block.update({
+                    "display_name": _DISPLAY.get(metric_key, metric_key),
+                    "basis": basis,
+                    "source": source,
+                    "framework": profile_def.get("framework", "Physiological"),
+                    "formula": profile_def.get("formula"),
+                    "thresholds": (
+                        _THRESHOLDS.get(metric_key)
+                        or profile_def.get("criteria")
+                    ),
+                    "interpretation": (
+                        _CONTEXT.get(metric_key)
+                        or profile_def.get("interpretation")
+                    ),
+                    "coaching_implication": (
+                        _LINKS.get(metric_key)
+                        or profile_def.get("coaching_implication")
+                    ),
+                    "related_metrics": profile_def.get("criteria", {}),
+                })
 
-            # 🧭 Phase-awareness
-            block["phase_context"] = (
-                context.get("current_phase")
-                or (semantic.get("phases", [{}])[-1].get("phase") if semantic.get("phases") else "")
-                or ""
-            )
+                # 🧭 Phase-awareness
+                block["phase_context"] = (
+                    context.get("current_phase")
+                    or (semantic.get("phases", [{}])[-1].get("phase") if semantic.get("phases") else "")
+                    or ""
+                )
 
-            return block
+                # Variants are weekly / contextual — tag at build time
+                block["context_window"] = "7d"
 
-        # --- Fused (sport-specific HR+Power)
-        pi_fused = context.get("Polarisation_fused") or context.get("Polarisation")
-        if pi_fused is not None:
-            polarisation_variants["fused"] = build_variant(
-                "Polarisation_fused",
-                pi_fused,
-                f"Fused HR+Power (dominant sport: {context.get('polarisation_sport', 'Unknown')})",
-                "zones.fused",
-            )
-            debug(context, f"[SEMANTIC] Polarisation_fused={pi_fused}")
-
-        # --- Combined (multi-sport HR+Power)
-        pi_combined = context.get("Polarisation_combined") or context.get("PolarisationIndex")
-        if pi_combined is not None:
-            polarisation_variants["combined"] = build_variant(
-                "Polarisation_combined",
-                pi_combined,
-                "Power where available, HR otherwise (multi-sport weighted)",
-                "zones.combined",
-            )
-            debug(context, f"[SEMANTIC] Polarisation_combined={pi_combined}")
+                return block
+
+            # --- Fused (sport-specific HR+Power)
+            if pi_fused is not None:
+                polarisation_variants["fused"] = build_variant(
+                    "Polarisation_fused",
+                    pi_fused,
+                    f"Fused HR+Power (dominant sport: {context.get('polarisation_sport', 'Unknown')})",
+                    "zones.fused",
+                )
+                debug(context, f"[SEMANTIC] Polarisation_fused={pi_fused}")
+
+            # --- Combined (multi-sport HR+Power)
+            if pi_combined is not None:
+                polarisation_variants["combined"] = build_variant(
+                    "Polarisation_combined",
+                    pi_combined,
+                    "Power where available, HR otherwise (multi-sport weighted)",
+                    "zones.combined",
+                )
+                debug(context, f"[SEMANTIC] Polarisation_combined={pi_combined}")
 
-        # --- Inject into semantic
-        if polarisation_variants:
+            # --- Inject into semantic (at least one variant exists here)
             semantic.setdefault("metrics", {})
             semantic["metrics"]["Polarisation_variants"] = polarisation_variants
             debug(
                 context,
                 f"[SEMANTIC] ✅ Injected Polarisation variants → {list(polarisation_variants.keys())}"
             )
-        else:
-            debug(context, "[SEMANTIC] ⚠️ No valid Polarisation variants found in context")
-
-        # --- Explicit context window for Polarisation variants (weekly, contextual)
-        if "Polarisation_variants" in semantic.get("metrics", {}):
-            for v in semantic["metrics"]["Polarisation_variants"].values():
-                if isinstance(v, dict):
-                    v["context_window"] = "7d"
 
-    except Exception as e:
-        debug(context, f"[SEMANTIC] ⚠️ Could not build polarisation variants: {e}")
+        except Exception as e:
+            debug(context, f"[SEMANTIC] ⚠️ Could not build polarisation variants: {e}")
 
     # ------------------------------------------------------------------
     # 🧬 Lactate, HRV and Threshold Integration (Cheat-Sheet aligned)
@@ -770,17 +973,17 @@ def build_semantic_json(context):
     try:
         # --- Lactate defaults (only if derived metrics didn't set them)
         if "lactate_thresholds_dict" not in context:
-            lac_defaults = CHEAT_SHEET["thresholds"].get("Lactate", {})
+            lac_defaults = _THRESHOLDS.get("Lactate", {})
             context["lactate_thresholds_dict"] = {
                 "lt1_mmol": lac_defaults.get("lt1_mmol", 2.0),
                 "lt2_mmol": lac_defaults.get("lt2_mmol", 4.0),
                 "corr_threshold": lac_defaults.get("corr_threshold", 0.6),
-                "notes": CHEAT_SHEET.get("context", {}).get("Lactate", "Lactate thresholds derived from cheat-sheet."),
+                "notes": _CONTEXT.get("Lactate", "Lactate thresholds derived from cheat-sheet."),
             }
 
         # --- HRV defaults (always safe to include)
-        hrv_profile = COACH_PROFILE.get("markers", {}).get("HRV", {})
-        hrv_defaults = CHEAT_SHEET["thresholds"].get("HRV", {})
+        hrv_profile = _MARKERS.get("HRV", {})
+        hrv_defaults = _THRESHOLDS.get("HRV", {})
         semantic["hrv_defaults"] = {
             "optimal": hrv_profile.get("criteria", {}).get("optimal")
                         or hrv_defaults.get("optimal")
@@ -802,49 +1005,39 @@ def build_semantic_json(context):
 
     # --- Derive report period and meta window ---
     report_type = context.get("report_type", "weekly").lower()
-    df_ref = None
+    # Keyed on the raw report_type, as the wellness-only daily check always was
+    features = _REPORT_FEATURES.get(context.get("report_type"), _DEFAULT_FEATURES)
 
-    # --- Select dataset based on report type ---
-    if report_type in ("season", "summary"):
-        # ✅ Prefer the preserved full dataset if available (all activity types)
-        if "_df_scope_full" in context and isinstance(context["_df_scope_full"], pd.DataFrame) and not context["_df_scope_full"].empty:
-            df_ref = context["_df_scope_full"]
-            debug(context, f"[SEMANTIC-FORCE] Using _df_scope_full for summary (rows={len(df_ref)})")
-        elif "activities_full" in context and isinstance(context["activities_full"], list) and len(context["activities_full"]) > 0:
-            df_ref = pd.DataFrame(context["activities_full"])
-            debug(context, f"[SEMANTIC-FORCE] Using activities_full for summary (rows={len(df_ref)})")
-        elif "df_light" in context and isinstance(context["df_light"], pd.DataFrame) and not context["df_light"].empty:
-            df_ref = context["df_light"]
-            debug(context, f"[SEMANTIC-FORCE] Fallback to df_light (rows={len(df_ref)})")
-        elif isinstance(context.get("activities_light"), list) and context["activities_light"]:
-            df_ref = pd.DataFrame(context["activities_light"])
-            debug(context, f"[SEMANTIC-FORCE] Fallback to activities_light (rows={len(df_ref)})")
-
-    elif report_type == "wellness":
-        df_well = context.get("df_wellness")
-        if isinstance(df_well, pd.DataFrame) and not df_well.empty:
-            df_ref = df_well
-        elif isinstance(context.get("wellness"), list) and len(context["wellness"]) > 0:
-            df_ref = pd.DataFrame(context["wellness"])
+    # List payloads → DataFrame lazily, at most once per build
+    # (several dataset-selection branches below can land on the same list)
+    list_frames = {}
 
-    else:
-        df_master = context.get("df_master")
-        if isinstance(df_master, pd.DataFrame) and not df_master.empty:
-            df_ref = df_master
-        elif isinstance(context.get("activities_full"), list) and len(context["activities_full"]) > 0:
-            df_ref = pd.DataFrame(context["activities_full"])
+    def frame_from_list(key):
+        if key not in list_frames:
+            list_frames[key] = pd.DataFrame(context[key])
+        return list_frames[key]
 
+    # --- Select dataset based on report type ---
+    df_ref, df_ref_source = resolve_df_ref(
+        context,
+        _DF_REF_SOURCES.get(report_type, _DEFAULT_DF_REF_SOURCES),
+        frame_from_list,
+    )
+    if df_ref is not None:
+        debug(context, f"[SEMANTIC-FORCE] Using {df_ref_source} for {report_type} (rows={len(df_ref)})")
 
     # --- Fallback: preserved df_scope_full (Railway safe)
     if df_ref is None and "_df_scope_full" in context and isinstance(context["_df_scope_full"], pd.DataFrame):
         df_ref = context["_df_scope_full"]
     
     # --- Compute report period from reference dataset ---
+    #     (all dates in this module are ISO-8601 — YYYY-MM-DD[THH:MM:SS] —
+    #      so pd.to_datetime gets format="ISO8601" and skips inference)
     if report_type in ("season", "summary") and context.get("window_start") and context.get("window_end"):
         # 🔒 Controller-defined window is authoritative
         context["period"] = {
-            "start": pd.to_datetime(context["window_start"]).strftime("%Y-%m-%d"),
-            "end": pd.to_datetime(context["window_end"]).strftime("%Y-%m-%d"),
+            "start": pd.to_datetime(context["window_start"], format="ISO8601").date().isoformat(),
+            "end": pd.to_datetime(context["window_end"], format="ISO8601").date().isoformat(),
         }
         debug(
             context,
@@ -860,8 +1053,15 @@ def build_semantic_json(context):
             if "start_date_local" in df_ref.columns
             else df_ref.columns[0]
         )
-        start_date = pd.to_datetime(df_ref[date_col], errors="coerce").min().strftime("%Y-%m-%d")
-        end_date = pd.to_datetime(df_ref[date_col], errors="coerce").max().strftime("%Y-%m-%d")
+        # Parse once; sorted frames (the usual case) read the ends in O(1)
+        # (is_monotonic_increasing is False whenever NaT is present)
+        dates = pd.to_datetime(df_ref[date_col], format="ISO8601", errors="coerce")
+        if dates.is_monotonic_increasing:
+            first, last = dates.iloc[0], dates.iloc[-1]
+        else:
+            first, last = dates.min(), dates.max()
+        start_date = first.strftime("%Y-%m-%d")
+        end_date = last.strftime("%Y-%m-%d")
         context["period"] = {"start": start_date, "end": end_date}
         debug(context, f"[SEMANTIC] Derived period from {report_type} dataset → {start_date} → {end_date}")
 
@@ -878,7 +1078,11 @@ def build_semantic_json(context):
 
     # --- Enrich meta block from authoritative REPORT_HEADERS ---
     semantic.setdefault("meta", {})
-    window_days = (pd.to_datetime(context["period"]["end"]) - pd.to_datetime(context["period"]["start"])).days
+    # period is always "YYYY-MM-DD" here → stdlib ISO parse, no pandas dispatch
+    window_days = (
+        date.fromisoformat(context["period"]["end"])
+        - date.fromisoformat(context["period"]["start"])
+    ).days
 
     header = REPORT_HEADERS.get(report_type, {})
     semantic["meta"]["report_type"] = report_type
@@ -904,36 +1108,34 @@ def build_semantic_json(context):
     # ---------------------------------------------------------
     # 🧹 Inject DAILY wellness fields (wellness report only)
     # ---------------------------------------------------------
-    if (
-        context.get("report_type") == "wellness"
-        and "wellness_daily" in context
-        and context["wellness_daily"]
-    ):
-        cleaned_daily = []
-
-        for row in context["wellness_daily"]:
-            cleaned = {
+    if "daily" in features and context.get("wellness_daily"):
+        # Single pass per row; each row keeps its own key order and types
+        semantic["wellness"]["daily"] = [
+            cleaned
+            for row in context["wellness_daily"]
+            if (cleaned := {
                 k: v
                 for k, v in row.items()
-                if v is not None
-                and not (isinstance(v, float) and math.isnan(v))
-            }
-            if cleaned:
-                cleaned_daily.append(cleaned)
-
-        semantic["wellness"]["daily"] = cleaned_daily
+                if v is not None and not (isinstance(v, float) and v != v)
+            })
+        ]
 
     # 🩵 Inject HRV summary & 42-day series
-    if "df_wellness" in context and not getattr(context["df_wellness"], "empty", True):
+    if (
+        "hrv" in features
+        and "df_wellness" in context
+        and not getattr(context["df_wellness"], "empty", True)
+    ):
         dfw = context["df_wellness"]
         if "hrv" in dfw.columns:
-            vals = pd.to_numeric(dfw["hrv"], errors="coerce").dropna()
-            if len(vals) > 0:
+            # One numeric pass → plain ndarray for the window statistics
+            vals = pd.to_numeric(dfw["hrv"], errors="coerce").dropna().to_numpy()
+            if vals.size > 0:
                 mean_val = round(vals.mean(), 1)
-                latest_val = round(vals.iloc[-1], 1)
+                latest_val = round(vals[-1], 1)
                 trend_val = (
-                    round(vals.tail(7).mean() - vals.head(7).mean(), 1)
-                    if len(vals) >= 14 else None
+                    round(vals[-7:].mean() - vals[:7].mean(), 1)
+                    if vals.size >= 14 else None
                 )
 
                 semantic["wellness"].update({
@@ -942,10 +1144,10 @@ def build_semantic_json(context):
                     "hrv_trend_7d": trend_val,
                     "hrv_source": context.get("hrv_source", "unknown"),
                     "hrv_available": True,
-                    "hrv_samples": int(len(vals)),
+                    "hrv_samples": int(vals.size),
                     "hrv_series": dfw.tail(42)[["date", "hrv"]]
                         .dropna()
-                        .assign(date=lambda x: pd.to_datetime(x["date"]).dt.strftime("%Y-%m-%d"))
+                        .assign(date=lambda x: pd.to_datetime(x["date"], format="ISO8601").dt.strftime("%Y-%m-%d"))
                         .to_dict(orient="records"),
                 })
                 debug(
@@ -963,33 +1165,33 @@ def build_semantic_json(context):
     # ---------------------------------------------------------
     # 🧠 Wrap subjective markers (and clean nulls)
     # ---------------------------------------------------------
-    subjective_fields = ["recovery", "fatigue", "fitness", "form"]
-    subjective_block = {}
-    for k, v in context.get("wellness_summary", {}).items():
-        if (
-            k in subjective_fields
-            and not (
-                v is None
-                or (isinstance(v, (float, int)) and pd.isna(v))
-                or (isinstance(v, (list, dict, np.ndarray)) and len(v) == 0)
-                or v == ""
-            )
-        ):
-            subjective_block[k] = v
+    if "subjective" in features:
+        subjective_fields = ["recovery", "fatigue", "fitness", "form"]
+        subjective_block = {}
+        for k, v in context.get("wellness_summary", {}).items():
+            if (
+                k in subjective_fields
+                and not (
+                    v is None
+                    or (isinstance(v, (float, int)) and pd.isna(v))
+                    or (isinstance(v, (list, dict, np.ndarray)) and len(v) == 0)
+                    or v == ""
+                )
+            ):
+                subjective_block[k] = v
 
-    # ✅ Always preserve key for schema consistency
-    semantic["wellness"]["subjective"] = subjective_block or {}
+        # ✅ Always preserve key for schema consistency
+        semantic["wellness"]["subjective"] = subjective_block or {}
 
-    debug(
-        context,
-        f"[SEMANTIC] Wellness subjective markers → keys={list(semantic['wellness']['subjective'].keys())}"
-    )
+        debug(
+            context,
+            f"[SEMANTIC] Wellness subjective markers → keys={list(semantic['wellness']['subjective'].keys())}"
+        )
 
 
     # ---------------------------------------------------------
     # AUTHORITATIVE TOTALS (Tier-2 ONLY)
     # ---------------------------------------------------------
-    report_type = semantic["meta"]["report_type"]
 
     # ---------------------------------------------------------
     # WEEKLY TOTALS (Tier-2 ONLY) - SEASON AND SUMMARY ARE IN PHASES
@@ -1071,12 +1273,20 @@ def build_semantic_json(context):
     ftp = None
     eftp = None
     lthr = None
+    sport_max_hr = None
+    primary_sport_str = None
+    custom_fields = {}
 
+    # Primary sport read once: markers, sport types, custom fields
     if isinstance(primary_sport, dict):
         ftp = primary_sport.get("ftp")
         mmp_model = primary_sport.get("mmp_model", {}) or {}
         eftp = mmp_model.get("ftp")
         lthr = primary_sport.get("lthr")
+        sport_max_hr = primary_sport.get("max_hr")
+        primary_sport_str = ",".join(primary_sport.get("types", []))
+        # --- Custom physiological fields (now pulled from sportSettings)
+        custom_fields = primary_sport.get("custom_field_values", {}) or {}
 
     # Fallbacks
     ftp = ftp or athlete.get("icu_ftp")
@@ -1084,19 +1294,21 @@ def build_semantic_json(context):
     lthr = lthr or athlete.get("icu_threshold_hr")
 
     # --- Resolve max HR from primary sport if not on root
-    max_hr = athlete.get("max_hr")
-    if not max_hr and isinstance(primary_sport, dict):
-        max_hr = primary_sport.get("max_hr")
-
-    # --- Custom physiological fields (now pulled from sportSettings)
-    custom_fields = {}
-    if isinstance(primary_sport, dict):
-        custom_fields = primary_sport.get("custom_field_values", {}) or {}
+    max_hr = athlete.get("max_hr") or sport_max_hr
 
     vo2max_garmin = custom_fields.get("VO2MaxGarmin")
     lactate_mmol_l = custom_fields.get("HrtLndLt1")
     lactate_power = custom_fields.get("HrtLndLt1p")
 
+    # --- Equipment: one pass over bikes (primary + distance total)
+    bikes = athlete.get("bikes") or []
+    primary_bike = None
+    total_bike_km = 0
+    for b in bikes:
+        total_bike_km += (b.get("distance", 0) or 0) / 1000
+        if primary_bike is None and b.get("primary"):
+            primary_bike = b.get("name")
+
     # -----------------------------------------------------
     # BUILD SEMANTIC BLOCK
     # -----------------------------------------------------
@@ -1132,7 +1344,7 @@ def build_semantic_json(context):
             "lthr": lthr,
             "resting_hr": athlete.get("icu_resting_hr"),
             "max_hr": max_hr,
-            "primary_sport": ",".join(primary_sport.get("types", [])) if isinstance(primary_sport, dict) else None,
+            "primary_sport": primary_sport_str,
             # --- Extended physiological fields from custom_field_values
             "vo2max_garmin": vo2max_garmin,
             "lactate_mmol_l": lactate_mmol_l,
@@ -1183,17 +1395,13 @@ def build_semantic_json(context):
                 "timezone": athlete.get("timezone"),
             },
             "equipment_summary": {
-                "bike_count": len(athlete.get("bikes", [])),
+                "bike_count": len(bikes),
                 "shoe_count": len(athlete.get("shoes", [])),
-                "primary_bike": next(
-                    (b.get("name") for b in athlete.get("bikes", []) if b.get("primary")), None
-                ),
-                "total_bike_distance_km": sum(
-                    (b.get("distance", 0) or 0) / 1000 for b in athlete.get("bikes", [])
-                ),
+                "primary_bike": primary_bike,
+                "total_bike_distance_km": total_bike_km,
             },
             "activity_scope": {
-                "primary_sports": [s.get("types", []) for s in athlete.get("sportSettings", [])],
+                "primary_sports": [s.get("types", []) for s in sports],
                 "active_since": athlete.get("icu_activated"),
                 "last_seen": athlete.get("icu_last_seen"),
             },
@@ -1204,7 +1412,7 @@ def build_semantic_json(context):
     # ---------------------------------------------------------
     # EVENTS (canonical)
     # ---------------------------------------------------------
-    df_events = context["_df_scope_full"]
+    df_events = context["_df_scope_full"] if "events" in features else None
 
     if isinstance(df_events, pd.DataFrame) and not df_events.empty:
         debug(context, f"[DEBUG-EVENTS] sample type={type(df_events)} rows={len(df_events)} cols_sample={str(list(df_events.columns))[:100]}")
@@ -1223,17 +1431,17 @@ def build_semantic_json(context):
         ]
 
         # Identify which core fields actually exist in the incoming df
-        available_fields = [f for f in core_fields if f in df_events.columns]
-        missing_fields = [f for f in core_fields if f not in df_events.columns]
+        event_cols = frozenset(df_events.columns)
+        available_fields = [f for f in core_fields if f in event_cols]
+
+        # ✅ Only include fields that have real (non-null, non-NaN, non-empty) values
+        #    — mask computed column-wise once, records emitted by pandas
+        df_ev = df_events[available_fields]
+        keep_mask = (df_ev.notna() & df_ev.ne("")).to_numpy()
 
         semantic["events"] = []
-        for _, row in df_events.iterrows():
-            # ✅ Only include fields that have real (non-null, non-NaN, non-empty) values
-            ev = {
-                k: row[k]
-                for k in available_fields
-                if pd.notna(row[k]) and row[k] != "" and row[k] is not None
-            }
+        for rec, keep in zip(df_ev.to_dict(orient="records"), keep_mask):
+            ev = {k: v for (k, v), ok in zip(rec.items(), keep) if ok}
 
             if "start_date_local" in ev:
                 ev["start_date_local"] = convert_to_str(ev["start_date_local"])
@@ -1258,31 +1466,24 @@ def build_semantic_json(context):
         debug(context, "[SEMANTIC] EVENTS: no df_events available or empty DataFrame")
 
 
-    # --- Prevent override by short df_scope_full for season/summary ---
-    if semantic["meta"]["report_type"] in ("season", "summary"):
-        if (
-            "df_light" in context
-            and isinstance(context["df_light"], pd.DataFrame)
-            and len(context["df_light"]) > 100
-        ):
-            df_ref = context["df_light"]
-            debug(context, f"[SEMANTIC-OVERRIDE] Using df_light ({len(df_ref)} rows) for summary/season instead of short _df_scope_full")
-        elif (
-            "_df_scope_full" in context
-            and isinstance(context["_df_scope_full"], pd.DataFrame)
-            and len(context["_df_scope_full"]) > 100
-        ):
-            df_ref = context["_df_scope_full"]
-            debug(context, f"[SEMANTIC-OVERRIDE] Using _df_scope_full ({len(df_ref)} rows) for summary/season")
+    # --- Season/summary totals: resolve the long-frame dataset once ---
+    #     (df_light > 100 rows → activities_light → _df_scope_full > 100 rows,
+    #      otherwise keep the period dataset chosen above)
+    if report_type in ("season", "summary"):
+        totals_ref, totals_source = resolve_df_ref(context, _TOTALS_DF_REF_SOURCES, frame_from_list)
+        if totals_ref is not None:
+            df_ref = totals_ref
+            debug(context, f"[SEMANTIC-OVERRIDE] Using {totals_source} ({len(df_ref)} rows) for {report_type} totals")
         else:
-            debug(context, "[SEMANTIC-OVERRIDE] No valid long-frame dataset found — fallback to df_master")
+            debug(context, "[SEMANTIC-OVERRIDE] No valid long-frame dataset found — keeping period dataset")
 
 
 
     # ---------------------------------------------------------
     # 🧩 DEBUG — verify light vs full data sources (before weekly aggregation)
+    #    verbose probes (row parsing, long f-strings) only in debug/diag runs
     # ---------------------------------------------------------
-    if semantic["meta"]["report_type"] in ("season", "summary"):
+    if report_type in ("season", "summary") and debug_enabled(context):
         debug(context, "🔍 [DATASET-DIAG] Checking available data sources:")
 
         for name in ["df_light", "activities_light", "_df_scope_full", "df_master", "df_events"]:
@@ -1305,12 +1506,12 @@ def build_semantic_json(context):
                 debug(context, f"🔍 [DATASET-DIAG] {name}: type={type(candidate).__name__}, value={str(candidate)[:80]}")
 
         # Explicit check for df_ref after it’s chosen
-        if "df_ref" in locals() and isinstance(df_ref, pd.DataFrame):
+        if isinstance(df_ref, pd.DataFrame):
             debug(
                 context,
                 f"🔍 [DATASET-DIAG] df_ref resolved → rows={len(df_ref)}, "
                 f"cols={list(df_ref.columns)[:6]}, "
-                f"date-range={pd.to_datetime(df_ref['start_date_local'] if 'start_date_local' in df_ref else df_ref['date']).agg(['min','max']).to_dict()}"
+                f"date-range={pd.to_datetime(df_ref['start_date_local'] if 'start_date_local' in df_ref else df_ref['date'], format='ISO8601').agg(['min','max']).to_dict()}"
             )
         else:
             debug(context, "⚠️ [DATASET-DIAG] df_ref not resolved or empty.")
@@ -1320,51 +1521,47 @@ def build_semantic_json(context):
     # ---------------------------------------------------------
     # 🪜 Weekly Phases Summary (URF v5.2 canonical)
     # ---------------------------------------------------------
-    if semantic["meta"]["report_type"] in ("season", "summary"):
-        # --- Force authoritative dataset for season/summary totals ---
-        if "df_light" in context and isinstance(context["df_light"], pd.DataFrame) and len(context["df_light"]) > 100:
-            df_ref = context["df_light"]
-            debug(context, f"[FORCE] Overriding df_ref with df_light ({len(df_ref)} rows) for totals aggregation")
-        elif isinstance(context.get("activities_light"), list) and len(context["activities_light"]) > 0:
-            df_ref = pd.DataFrame(context["activities_light"])
-            debug(context, f"[FORCE] Overriding df_ref with activities_light ({len(df_ref)} rows) for totals aggregation)")
+    if report_type in ("season", "summary"):
+        # Only these columns feed the weekly aggregation → copy a narrow slice
+        weekly_cols = ("start_date_local", "distance", "moving_time", "icu_training_load")
 
         df_src = None
-        if "df_ref" in locals() and isinstance(df_ref, pd.DataFrame) and not df_ref.empty:
-            df_src = df_ref.copy()
+        if isinstance(df_ref, pd.DataFrame) and not df_ref.empty:
+            df_src = df_ref[[c for c in weekly_cols if c in df_ref.columns]].copy()
             debug(context, f"[WEEKLY] Using df_ref with {len(df_src)} rows for weekly aggregation")
         else:
             for candidate_name in ["df_light", "activities_light", "_df_scope_full"]:
                 candidate = context.get(candidate_name)
                 if isinstance(candidate, pd.DataFrame) and not candidate.empty:
-                    df_src = candidate.copy()
+                    df_src = candidate[[c for c in weekly_cols if c in candidate.columns]].copy()
                     debug(context, f"[WEEKLY] Using fallback dataset: {candidate_name} ({len(df_src)} rows)")
                     break
 
         if df_src is not None and "start_date_local" in df_src.columns:
-            df_src["start_date_local"] = pd.to_datetime(df_src["start_date_local"], errors="coerce")
+            df_src["start_date_local"] = pd.to_datetime(df_src["start_date_local"], format="ISO8601", errors="coerce")
             df_src = df_src.dropna(subset=["start_date_local"])
 
-            # ✅ Coerce numeric and fill NaNs
-            for col in ["icu_training_load", "moving_time", "distance"]:
-                if col in df_src.columns:
-                    df_src[col] = (
-                        pd.to_numeric(df_src[col], errors="coerce")
-                        .fillna(0)
-                        .astype(float)
-                    )
+            # ✅ Coerce numeric and fill NaNs (one block op; parse only if needed)
+            num_cols = [c for c in ("icu_training_load", "moving_time", "distance") if c in df_src.columns]
+            if num_cols:
+                block = df_src[num_cols]
+                if not all(pd.api.types.is_numeric_dtype(t) for t in block.dtypes):
+                    block = block.apply(pd.to_numeric, errors="coerce")
+                df_src[num_cols] = block.fillna(0).astype(float)
 
             # 🔍 Pre-aggregation sanity check
-            debug(
-                context,
-                f"[CHECK] Before weekly aggregation → {len(df_src)} rows | "
-                f"Dist={df_src['distance'].sum()/1000:.1f} km | "
-                f"Hours={df_src['moving_time'].sum()/3600:.1f} h | "
-                f"TSS={df_src['icu_training_load'].sum():.0f}"
-            )
+            if debug_enabled(context):
+                debug(
+                    context,
+                    f"[CHECK] Before weekly aggregation → {len(df_src)} rows | "
+                    f"Dist={df_src['distance'].sum()/1000:.1f} km | "
+                    f"Hours={df_src['moving_time'].sum()/3600:.1f} h | "
+                    f"TSS={df_src['icu_training_load'].sum():.0f}"
+                )
 
-            iso = df_src["start_date_local"].dt.isocalendar()
-            df_src["year_week"] = iso["year"].astype(str) + "-W" + iso["week"].astype(str)
+            # Weekly periods ("W" = Mon–Sun, i.e. ISO weeks) as the group key;
+            # ISO labels + week starts are derived only for the aggregated weeks
+            df_src["year_week"] = df_src["start_date_local"].dt.to_period("W")
             df_week = (
                 df_src.groupby("year_week", as_index=False)
                 .agg({
@@ -1372,61 +1569,54 @@ def build_semantic_json(context):
                     "moving_time": "sum",
                     "icu_training_load": "sum"
                 })
-                .sort_values("year_week")
             )
+            week_start = df_week["year_week"].dt.start_time
+            iso = week_start.dt.isocalendar()
+            df_week["year_week"] = iso["year"].astype(str) + "-W" + iso["week"].astype(str)
 
             # 🔍 Post-aggregation sanity check
-            debug(
-                context,
-                f"[CHECK] After weekly aggregation → {len(df_week)} weeks | "
-                f"Dist={df_week['distance'].sum()/1000:.1f} km | "
-                f"Hours={df_week['moving_time'].sum()/3600:.1f} h | "
-                f"TSS={df_week['icu_training_load'].sum():.0f}"
-            )
+            if debug_enabled(context):
+                debug(
+                    context,
+                    f"[CHECK] After weekly aggregation → {len(df_week)} weeks | "
+                    f"Dist={df_week['distance'].sum()/1000:.1f} km | "
+                    f"Hours={df_week['moving_time'].sum()/3600:.1f} h | "
+                    f"TSS={df_week['icu_training_load'].sum():.0f}"
+                )
 
             # --- Phase linkage: map each week to its detected macro phase ---
-            def get_phase_for_week(week_label):
-                try:
-                    year, week = week_label.split("-W")
-                    week_start = pd.Timestamp.fromisocalendar(int(year), int(week), 1)
-                except Exception:
-                    return "Unclassified"
-
-                for p in context.get("phases", []):
-                    s = pd.to_datetime(p.get("start"))
-                    e = pd.to_datetime(p.get("end"))
-                    if s <= week_start <= e:
-                        return p.get("phase")
-                return "Unclassified"
+            #     (phase bounds parsed once; weeks × phases compared in one
+            #      broadcast, first matching phase wins; NaT never matches)
+            phases = context.get("phases", [])
+            df_week["phase"] = "Unclassified"
+            if phases:
+                week_starts = week_start.to_numpy()[:, None]
+                p_start = pd.to_datetime([p.get("start") for p in phases], format="ISO8601", errors="coerce").to_numpy()
+                p_end = pd.to_datetime([p.get("end") for p in phases], format="ISO8601", errors="coerce").to_numpy()
+                p_name = np.array([p.get("phase") for p in phases], dtype=object)
+
+                hit = (p_start <= week_starts) & (week_starts <= p_end)
+                matched = hit.any(axis=1)
+                df_week.loc[matched, "phase"] = p_name[hit.argmax(axis=1)[matched]]
 
             # --- Build unified weekly phase summary + compute totals ---
-            total_hours = 0.0
-            total_tss = 0.0
-            total_distance = 0.0
-            weekly_phases = []
-
-            for _, r in df_week.iterrows():
-                week_data = {
-                    "week": r["year_week"],
-                    "phase": get_phase_for_week(r["year_week"]),
-                    "distance_km": round(r["distance"] / 1000, 1),
-                    "hours": round(r["moving_time"] / 3600, 1),
-                    "tss": round(r["icu_training_load"], 0)
-                }
-
-                weekly_phases.append(week_data)
-
-                # 🔢 Increment totals directly
-                total_hours += week_data["hours"]
-                total_tss += week_data["tss"]
-                total_distance += week_data["distance_km"]
-
+            #     (column math, one records pass; totals sum the rounded weeks)
+            #     builtin round() keeps exact decimal ties (np.round scales first)
+            df_week["distance_km"] = [round(v, 1) for v in (df_week["distance"] / 1000).tolist()]
+            df_week["hours"] = [round(v, 1) for v in (df_week["moving_time"] / 3600).tolist()]
+            df_week["tss"] = [round(v, 0) for v in df_week["icu_training_load"].tolist()]
+
+            weekly_phases = (
+                df_week[["year_week", "phase", "distance_km", "hours", "tss"]]
+                .rename(columns={"year_week": "week"})
+                .to_dict(orient="records")
+            )
             semantic["weekly_phases"] = weekly_phases
 
             # ✅ Store canonical totals
-            semantic["hours"] = round(total_hours, 2)
-            semantic["tss"] = round(total_tss, 0)
-            semantic["distance_km"] = round(total_distance, 2)
+            semantic["hours"] = round(sum(df_week["hours"].tolist()), 2)
+            semantic["tss"] = round(sum(df_week["tss"].tolist()), 0)
+            semantic["distance_km"] = round(sum(df_week["distance_km"].tolist()), 2)
 
             # 🔒 Mirror totals into context (so finalizer sees them)
             context["locked_totalHours"] = semantic["hours"]
@@ -1448,57 +1638,53 @@ def build_semantic_json(context):
         else:
             debug(context, "[WEEKLY] ❌ No valid df_src found for weekly aggregation")
 
-    if "df_src" in locals() and isinstance(df_src, pd.DataFrame):
-        debug(
-            context,
-            f"[WEEKLY-TRACE] df_src rows={len(df_src)}, "
-            f"total distance={df_src['distance'].sum()/1000:.1f} km, "
-            f"hours={df_src['moving_time'].sum()/3600:.1f}, "
-            f"tss={df_src['icu_training_load'].sum():.0f}"
-        )
+    # 🔍 Aggregation traces re-sum whole columns — diagnostics only
+    if debug_enabled(context):
+        if "df_src" in locals() and isinstance(df_src, pd.DataFrame):
+            debug(
+                context,
+                f"[WEEKLY-TRACE] df_src rows={len(df_src)}, "
+                f"total distance={df_src['distance'].sum()/1000:.1f} km, "
+                f"hours={df_src['moving_time'].sum()/3600:.1f}, "
+                f"tss={df_src['icu_training_load'].sum():.0f}"
+            )
 
-    if "df_week" in locals() and isinstance(df_week, pd.DataFrame):
-        debug(
-            context,
-            f"[WEEKLY-TRACE] df_week rows={len(df_week)}, "
-            f"grouped distance={df_week['distance'].sum()/1000:.1f} km, "
-            f"hours={df_week['moving_time'].sum()/3600:.1f}, "
-            f"tss={df_week['icu_training_load'].sum():.0f}"
-        )
+        if "df_week" in locals() and isinstance(df_week, pd.DataFrame):
+            debug(
+                context,
+                f"[WEEKLY-TRACE] df_week rows={len(df_week)}, "
+                f"grouped distance={df_week['distance'].sum()/1000:.1f} km, "
+                f"hours={df_week['moving_time'].sum()/3600:.1f}, "
+                f"tss={df_week['icu_training_load'].sum():.0f}"
+            )
 
     # ---------------------------------------------------------
     # DERIVED EVENT SUMMARIES — W' Balance & Performance
     # ---------------------------------------------------------
 
-    report_type = semantic["meta"]["report_type"]
-
     # =========================================================
     # WEEKLY → per-session mean (robust to mixed sports)
     # =========================================================
-    if semantic["meta"]["report_type"] == "weekly":
-        df_ev = df_events.copy()
-
-        if {
-            "icu_pm_w_prime",
-            "icu_max_wbal_depletion",
-            "icu_joules_above_ftp",
-        } <= set(df_ev.columns):
-
-            df_ev = df_ev[
-                df_ev["icu_pm_w_prime"].notna()
-                & df_ev["icu_max_wbal_depletion"].notna()
-                & df_ev["icu_joules_above_ftp"].notna()
-            ]
-
-            if not df_ev.empty:
+    if report_type == "weekly":
+        if all(c in df_events.columns for c in _WBAL_COLS):
+
+            # Raw float arrays, one NaN mask across all three columns
+            wp, dep, jab = (
+                df_events[c].to_numpy(dtype=np.float64, na_value=np.nan)
+                for c in _WBAL_COLS
+            )
+            mask = ~(np.isnan(wp) | np.isnan(dep) | np.isnan(jab))
+
+            if mask.any():
+                wp = wp[mask]
                 with np.errstate(divide="ignore", invalid="ignore"):
-                    wbal_pct = df_ev["icu_max_wbal_depletion"] / df_ev["icu_pm_w_prime"]
-                    anaerobic_pct = df_ev["icu_joules_above_ftp"] / df_ev["icu_pm_w_prime"]
+                    wbal_pct = dep[mask] / wp
+                    anaerobic_pct = jab[mask] / wp
 
                 semantic["wbal_summary"] = {
-                    "mean_wbal_depletion_pct": round(float(wbal_pct.mean()), 3),
-                    "mean_anaerobic_contrib_pct": round(float(anaerobic_pct.mean()), 3),
-                    "sessions_with_wbal_data": int(len(df_ev)),
+                    "mean_wbal_depletion_pct": round(float(np.nanmean(wbal_pct)), 3),
+                    "mean_anaerobic_contrib_pct": round(float(np.nanmean(anaerobic_pct)), 3),
+                    "sessions_with_wbal_data": int(mask.sum()),
                     "basis": "per-session mean (W′-capable sessions only)",
                     "window": "weekly",
                 }
@@ -1514,39 +1700,33 @@ def build_semantic_json(context):
         if (
             isinstance(df, pd.DataFrame)
             and not df.empty
-            and {
-                "start_date_local",
-                "icu_pm_w_prime",
-                "icu_max_wbal_depletion",
-                "icu_joules_above_ftp",
-            } <= set(df.columns)
+            and all(c in df.columns for c in _WBAL_COLS_DATED)
         ):
-            df = df.copy()
-            df["start_date_local"] = pd.to_datetime(df["start_date_local"], errors="coerce")
-            df = df.dropna(subset=["start_date_local"])
+            dates = pd.to_datetime(df["start_date_local"], format="ISO8601", errors="coerce")
+            wp, dep, jab = (
+                df[c].to_numpy(dtype=np.float64, na_value=np.nan)
+                for c in _WBAL_COLS
+            )
 
             # 🔑 FILTER TO WBAL-CAPABLE SESSIONS (this is the missing piece)
-            df = df[
-                df["icu_pm_w_prime"].notna()
-                & df["icu_max_wbal_depletion"].notna()
-                & df["icu_joules_above_ftp"].notna()
-            ]
+            mask = dates.notna().to_numpy() & ~(np.isnan(wp) | np.isnan(dep) | np.isnan(jab))
 
-            if df.empty:
+            if not mask.any():
                 return  # or just skip silently
 
-            iso = df["start_date_local"].dt.isocalendar()
-            df["year_week"] = iso["year"].astype(str) + "-W" + iso["week"].astype(str)
-
+            iso = dates[mask].dt.isocalendar()
+            wp = wp[mask]
             with np.errstate(divide="ignore", invalid="ignore"):
-                df["wbal_pct"] = df["icu_max_wbal_depletion"] / df["icu_pm_w_prime"]
-                df["anaerobic_pct"] = df["icu_joules_above_ftp"] / df["icu_pm_w_prime"]
+                df_wb = pd.DataFrame({
+                    "yw_key": iso["year"].to_numpy(dtype=np.int64) * 100 + iso["week"].to_numpy(dtype=np.int64),
+                    "wbal_pct": dep[mask] / wp,
+                    "anaerobic_pct": jab[mask] / wp,
+                })
 
-            weekly = (
-                df.sort_values("wbal_pct", ascending=False)
-                .groupby("year_week", as_index=False)
-                .first()
-            )
+            # Peak session per ISO week: one linear idxmax per group, no global sort
+            #   (sessions with an undefined 0/0 ratio can never be a week's peak)
+            df_wb = df_wb[df_wb["wbal_pct"].notna()]
+            weekly = df_wb.loc[df_wb.groupby("yw_key", sort=False)["wbal_pct"].idxmax()]
 
             semantic["wbal_summary"] = {
                 "mean_wbal_depletion_pct": round(float(weekly["wbal_pct"].mean()), 3),
@@ -1570,16 +1750,17 @@ def build_semantic_json(context):
             "icu_power_hr": "mean_power_hr_ratio",
         }
 
+        # One numeric coercion + column-wise mean over all present fields
         perf_summary = {}
-        for in_name, out_name in perf_fields.items():
-            if in_name in df_ev.columns:
-                debug(context, f"[SEMANTIC-SUMMARY] Computing mean for {in_name}, dtype={df_ev[in_name].dtype}")
-                try:
-                    val_series = pd.to_numeric(df_ev[in_name], errors="coerce")
-                    perf_summary[out_name] = round(float(val_series.mean(skipna=True) or 0), 3)
-                except Exception as e:
-                    debug(context, f"[SEMANTIC-SUMMARY] Skipped {in_name}: {e}")
-                    perf_summary[out_name] = 0
+        cols = [c for c in perf_fields if c in df_ev.columns]
+        if cols:
+            debug(context, f"[SEMANTIC-SUMMARY] Computing means for {cols}")
+            try:
+                means = df_ev[cols].apply(pd.to_numeric, errors="coerce").mean(skipna=True)
+                perf_summary = {perf_fields[c]: round(float(means[c] or 0), 3) for c in cols}
+            except Exception as e:
+                debug(context, f"[SEMANTIC-SUMMARY] Skipped performance means: {e}")
+                perf_summary = {perf_fields[c]: 0 for c in cols}
 
         if perf_summary:
             semantic["performance_summary"] = perf_summary
@@ -1606,50 +1787,49 @@ def build_semantic_json(context):
             elif isinstance(start, str) and "T" in start:
                 start = start.split("T")[0]
 
-            event = {
-                "id": e.get("id"),
-                "uid": e.get("uid"),
-                "category": e.get("category", "OTHER"),
-                "name": e.get("name") or e.get("title") or "Untitled",
-                "description": e.get("description") or e.get("notes") or "",
-                "start_date_local": e.get("start_date_local"),
-                "end_date_local": e.get("end_date_local"),
-                "duration_minutes": resolve_planned_duration_minutes(e),
-                "icu_training_load": e.get("icu_training_load") or e.get("tss"),
-                "load_target": e.get("load_target"),
-                "time_target": e.get("time_target"),
-                "distance_target": e.get("distance_target"),
-                "strain_score": e.get("strain_score"),
-                "plan_name": e.get("plan_name"),
-                "plan_workout_id": e.get("plan_workout_id"),
-                "color": e.get("color"),
-                "tags": e.get("tags"),
-                "day_of_week": (
-                    datetime.fromisoformat(start).strftime("%A")
-                    if isinstance(start, str) and len(start) == 10
-                    else None
-                ),
-            }
-
-            # 🧹 Remove all null/NaN/empty values
+            # 🧹 Keep only real values — null/NaN/empty fields never enter the event
             event = {
                 k: v
-                for k, v in event.items()
-                if v not in (None, "", [], {}) and not (isinstance(v, float) and isnan(v))
+                for k, v in (
+                    ("id", e.get("id")),
+                    ("uid", e.get("uid")),
+                    ("category", e.get("category", "OTHER")),
+                    ("name", e.get("name") or e.get("title") or "Untitled"),
+                    ("description", e.get("description") or e.get("notes") or ""),
+                    ("start_date_local", e.get("start_date_local")),
+                    ("end_date_local", e.get("end_date_local")),
+                    ("duration_minutes", resolve_planned_duration_minutes(e)),
+                    ("icu_training_load", e.get("icu_training_load") or e.get("tss")),
+                )
+                if not _is_blank(v)
             }
+            for k in _PLANNED_PASSTHROUGH:
+                v = e.get(k)
+                if not _is_blank(v):
+                    event[k] = v
+            if isinstance(start, str) and len(start) == 10:
+                event["day_of_week"] = _weekday_name(start)
 
             planned_events.append(event)
+            # Per-day totals accumulated in the same pass: [events, duration, load, categories]
             if start:
-                planned_by_date.setdefault(start, []).append(event)
+                day = planned_by_date.get(start)
+                if day is None:
+                    day = planned_by_date[start] = [0, 0, 0, set()]
+                day[0] += 1
+                day[1] += event.get("duration_minutes") or 0
+                day[2] += event.get("icu_training_load") or 0
+                if event.get("category"):
+                    day[3].add(event["category"])
 
         planned_summary_by_date = {
             day: {
-                "total_events": len(events),
-                "total_duration": sum((e.get("duration_minutes") or 0) for e in events),
-                "total_load": sum((e.get("icu_training_load") or 0) for e in events),
-                "categories": sorted({e.get("category") for e in events if e.get("category")}),
+                "total_events": n_events,
+                "total_duration": duration,
+                "total_load": load,
+                "categories": sorted(categories),
             }
-            for day, events in planned_by_date.items()
+            for day, (n_events, duration, load, categories) in planned_by_date.items()
         }
 
         semantic["planned_events"] = planned_events
@@ -1661,8 +1841,7 @@ def build_semantic_json(context):
         context["calendar"] = calendar_data  # ✅ REQUIRED — Tier-3 reads THIS
 
         if not context.get("future_forecast"):
-            from audit_core.tier3_future_forecast import run_future_forecast
-            forecast_output = run_future_forecast(context)
+            forecast_output = _future_forecast_runner()(context)
 
             if isinstance(forecast_output, dict):
                 context.update(forecast_output)
@@ -1716,13 +1895,13 @@ def build_semantic_json(context):
                 debug(context, f"[SEMANTIC] ⚠️ {key}: no value in context")
                 continue
 
-            profile_def = COACH_PROFILE.get("markers", {}).get(key, {})
-            thresholds = CHEAT_SHEET.get("thresholds", {}).get(key, {})
+            profile_def = _MARKERS.get(key, _EMPTY)
+            thresholds = _THRESHOLDS.get(key, {})
 
             criteria = profile_def.get("criteria", thresholds)
             notes = (
                 profile_def.get("interpretation")
-                or CHEAT_SHEET.get("context", {}).get(key)
+                or _CONTEXT.get(key)
                 or ""
             )
             framework = profile_def.get("framework", "physiological")
@@ -1757,13 +1936,13 @@ def build_semantic_json(context):
                 debug(context, f"[SEMANTIC] ⚠️ {key}: no value in context")
                 continue
 
-            profile_def = COACH_PROFILE.get("markers", {}).get(key, {})
-            thresholds = CHEAT_SHEET.get("thresholds", {}).get(key, {})
+            profile_def = _MARKERS.get(key, _EMPTY)
+            thresholds = _THRESHOLDS.get(key, {})
             criteria = profile_def.get("criteria", thresholds)
 
             notes = (
                 profile_def.get("interpretation")
-                or CHEAT_SHEET.get("context", {}).get(key)
+                or _CONTEXT.get(key)
                 or ""
             )
             framework = profile_def.get("framework", "physiological")
@@ -1787,36 +1966,8 @@ def build_semantic_json(context):
     # ---------------------------------------------------------
     # Annotate context windows per metric
     # ---------------------------------------------------------
-    metric_windows = {
-        # Short-term / 7-day metrics
-        "Polarisation": "7d",
-        "PolarisationIndex": "7d",
-        "FatOxEfficiency": "7d",
-        "FOxI": "7d",
-        "MES": "7d",
-        "CUR": "7d",
-        "GR": "7d",
-        "RecoveryIndex": "7d",
-        "StressTolerance": "7d",
-        "ZQI": "7d",
-
-        # Long-term / 90-day metrics
-        "CTL": "90d",
-        "ATL": "90d",
-        "TSB": "90d",
-        "RampRate": "90d",
-        "FatigueTrend": "90d",
-        "AerobicDecay": "90d",
-        "Durability": "90d",
-
-        # Rolling or composite metrics
-        "ACWR": "rolling",
-        "Monotony": "rolling",
-        "Strain": "rolling",
-    }
-
     for name, metric in semantic["metrics"].items():
-        metric["context_window"] = metric_windows.get(name, "unknown")
+        metric["context_window"] = _METRIC_WINDOWS.get(name, "unknown")
 
 
 
@@ -1896,8 +2047,6 @@ def build_semantic_json(context):
         "phases_detail": full_phases_for_view
     })
 
-    semantic["context_ref"] = context
-
 
     # ---------------------------------------------------------
     # 🧹 CLEANUP — ensure only one authoritative actions section
@@ -1913,7 +2062,7 @@ def build_semantic_json(context):
     # ----------------------------------------------------------
     # Cleanup Phases for weekly and wellness
     # ----------------------------------------------------------
-    if semantic["meta"]["report_type"] in ("weekly", "wellness"):
+    if report_type in ("weekly", "wellness"):
         if "insight_view" in semantic and "phases" in semantic["insight_view"]:
             del semantic["insight_view"]["phases"]
             debug(context, "[SEMANTIC] Pruned phases from insight_view (short-term report)")
@@ -1939,8 +2088,6 @@ def build_semantic_json(context):
     ✅ phases_summary → macro roll-up (duration, total load, descriptors)
     """
 
-    report_type = semantic["meta"].get("report_type")
-
 
     # ---------------------------------------------------------
     # 🌍 Season / Summary → full weekly + roll-up
@@ -1953,73 +2100,64 @@ def build_semantic_json(context):
         else:
             df_weeks = pd.DataFrame(raw_weeks)
 
-            # Derive start/end for each ISO week
-            def week_to_dates(week_label):
-                try:
-                    y, wk = str(week_label).split("-W")
-                    start = pd.Timestamp.fromisocalendar(int(y), int(wk), 1)
-                    end = start + pd.Timedelta(days=6)
-                    return start, end
-                except Exception:
-                    return pd.NaT, pd.NaT
-
-            df_weeks[["start", "end"]] = df_weeks["week"].apply(lambda w: pd.Series(week_to_dates(w)))
+            # Derive start/end for each ISO week (one vectorised parse; bad labels → NaT)
+            yw = df_weeks["week"].astype(str).str.extract(r"^(\d+)-W(\d+)$")
+            df_weeks["start"] = pd.to_datetime(
+                yw[0] + "-W" + yw[1].str.zfill(2) + "-1", format="%G-W%V-%u", errors="coerce"
+            )
+            df_weeks["end"] = df_weeks["start"] + pd.Timedelta(days=6)
 
             # -----------------------------------------------------
             # 🧩 Inject CTL/ATL/TSB per week (from df_light / df_master)
             # -----------------------------------------------------
             ctl_src = pd.DataFrame()
             for key in ["df_light", "df_master"]:
-                if isinstance(context.get(key), pd.DataFrame) and not context[key].empty:
-                    df_tmp = context[key].copy()
-
-                    # Normalise Intervals fields
-                    rename_map = {
-                        "icu_ctl": "CTL",
-                        "icu_atl": "ATL",
-                        "icu_training_load": "tss"
-                    }
-                    df_tmp.rename(columns=rename_map, inplace=True)
-
-                    # Compute TSB dynamically if missing
-                    if "TSB" not in df_tmp.columns and all(c in df_tmp.columns for c in ["CTL", "ATL"]):
-                        df_tmp["TSB"] = df_tmp["CTL"] - df_tmp["ATL"]
+                df_key = context.get(key)
+                if isinstance(df_key, pd.DataFrame) and not df_key.empty:
+                    # Normalise Intervals fields (rename returns a new frame — no copy first)
+                    df_tmp = df_key.rename(columns={"icu_ctl": "CTL", "icu_atl": "ATL"})
 
                     # Find the best date column
-                    date_col = None
-                    for c in ["start_date_local", "start_date", "date"]:
-                        if c in df_tmp.columns:
-                            date_col = c
-                            break
+                    date_col = next(
+                        (c for c in ("start_date_local", "start_date", "date") if c in df_tmp.columns),
+                        None,
+                    )
 
                     if date_col:
-                        ctl_src = df_tmp[[date_col, "CTL", "ATL", "TSB"]].copy()
-                        ctl_src.rename(columns={date_col: "date"}, inplace=True)
+                        # Only the needed columns; TSB computed dynamically if missing
+                        if "TSB" in df_tmp.columns:
+                            ctl_src = df_tmp[[date_col, "CTL", "ATL", "TSB"]]
+                        else:
+                            ctl_src = df_tmp[[date_col, "CTL", "ATL"]]
+                            ctl_src = ctl_src.assign(TSB=ctl_src["CTL"] - ctl_src["ATL"])
+                        ctl_src = ctl_src.rename(columns={date_col: "date"})
                     break
 
             # -----------------------------------------------------
             # Aggregate by ISO week
             # -----------------------------------------------------
             if not ctl_src.empty:
-                ctl_src["date"] = pd.to_datetime(ctl_src["date"], errors="coerce")
-                ctl_src["year_week"] = (
-                    ctl_src["date"].dt.isocalendar().year.astype(str)
-                    + "-W"
-                    + ctl_src["date"].dt.isocalendar().week.astype(str)
-                )
+                ctl_src["date"] = pd.to_datetime(ctl_src["date"], format="ISO8601", errors="coerce")
+                # Integer ISO key (year*100 + week); labels formatted per week only
+                iso = ctl_src["date"].dt.isocalendar()
+                ctl_src["yw_key"] = iso["year"].astype("Int64") * 100 + iso["week"].astype("Int64")
                 df_ctl = (
-                    ctl_src.groupby("year_week", as_index=False)
+                    ctl_src.groupby("yw_key", as_index=False, sort=False)
                     .agg({"CTL": "mean", "ATL": "mean", "TSB": "mean"})
                 )
+                df_ctl["yw_key"] = (
+                    (df_ctl["yw_key"] // 100).astype(str) + "-W" + (df_ctl["yw_key"] % 100).astype(str)
+                )
                 df_ctl.columns = ["week", "ctl", "atl", "tsb"]
                 df_weeks = df_weeks.merge(df_ctl, on="week", how="left")
 
-                # Diagnostic
-                debug(
-                    context,
-                    f"[PHASES] ✅ Injected CTL/ATL/TSB from {key} "
-                    f"({len(df_ctl)} weekly rows) — mean TSB={df_ctl['tsb'].mean():.2f}"
-                )
+                # Diagnostic (mean TSB re-scans the column — debug runs only)
+                if debug_enabled(context):
+                    debug(
+                        context,
+                        f"[PHASES] ✅ Injected CTL/ATL/TSB from {key} "
+                        f"({len(df_ctl)} weekly rows) — mean TSB={df_ctl['tsb'].mean():.2f}"
+                    )
             else:
                 ctl_val = semantic.get("extended_metrics", {}).get("CTL", {}).get("value", 0.0)
                 atl_val = semantic.get("extended_metrics", {}).get("ATL", {}).get("value", 0.0)
@@ -2030,15 +2168,19 @@ def build_semantic_json(context):
             # -----------------------------------------------------
             # Classify per week using TSB thresholds
             # -----------------------------------------------------
-            tsb_thresholds = CHEAT_SHEET.get("thresholds", {}).get("TSB", {})
-
-            def classify_tsb(tsb_value):
-                for label, (lo, hi) in tsb_thresholds.items():
-                    if lo <= tsb_value < hi:
-                        return label.capitalize()
-                return "Unknown"
-
-            df_weeks["classification"] = df_weeks["tsb"].apply(classify_tsb)
+            tsb_thresholds = _THRESHOLDS.get("TSB", {})
+
+            # Bands in cheat-sheet order, first lo <= TSB < hi wins; NaN → Unknown
+            bands = [(label.capitalize(), lo, hi) for label, (lo, hi) in tsb_thresholds.items()]
+            tsb = df_weeks["tsb"].to_numpy(dtype=np.float64, na_value=np.nan)
+            df_weeks["classification"] = (
+                np.select(
+                    [(lo <= tsb) & (tsb < hi) for _, lo, hi in bands],
+                    [label for label, _, _ in bands],
+                    default="Unknown",
+                ).tolist()
+                if bands else "Unknown"
+            )
 
             # -----------------------------------------------------
             # 🔗 Propagate calc_method / calc_context from detect_phases()
@@ -2052,21 +2194,33 @@ def build_semantic_json(context):
                     if "calc_context" not in df_weeks.columns:
                         df_weeks["calc_context"] = None
 
-                    # Match by overlapping date ranges
-                    for idx, row in df_weeks.iterrows():
-                        wk_start, wk_end = row["start"], row["end"]
-                        matched = df_detected[
-                            (pd.to_datetime(df_detected["start"]) <= wk_end)
-                            & (pd.to_datetime(df_detected["end"]) >= wk_start)
-                        ]
-                        if not matched.empty:
-                            df_weeks.at[idx, "calc_method"] = matched.iloc[-1].get("calc_method")
-
-                            context_val = matched.iloc[-1].get("calc_context")
-                            # ✅ Safe assignment for dict values (keeps them scalar)
-                            df_weeks.at[idx, "calc_context"] = (
-                                context_val if isinstance(context_val, (dict, type(None))) else dict(context_val)
-                            )
+                    # Match by overlapping date ranges — weeks × phases in one
+                    # broadcast; the last overlapping detected phase wins
+                    det_start = pd.to_datetime(df_detected["start"], format="ISO8601").to_numpy()
+                    det_end = pd.to_datetime(df_detected["end"], format="ISO8601").to_numpy()
+                    hit = (
+                        (det_start <= df_weeks["end"].to_numpy()[:, None])
+                        & (det_end >= df_weeks["start"].to_numpy()[:, None])
+                    )
+                    matched = hit.any(axis=1)
+                    last = hit.shape[1] - 1 - hit[:, ::-1].argmax(axis=1)
+
+                    no_value = [None] * len(df_detected)
+                    det_method = df_detected["calc_method"].tolist() if "calc_method" in df_detected else no_value
+                    det_context = df_detected["calc_context"].tolist() if "calc_context" in df_detected else no_value
+
+                    calc_method = df_weeks["calc_method"].tolist()
+                    calc_context = df_weeks["calc_context"].tolist()
+                    for i in np.flatnonzero(matched):
+                        j = last[i]
+                        calc_method[i] = det_method[j]
+                        context_val = det_context[j]
+                        # ✅ Safe assignment for dict values (keeps them scalar)
+                        calc_context[i] = (
+                            context_val if isinstance(context_val, (dict, type(None))) else dict(context_val)
+                        )
+                    df_weeks["calc_method"] = pd.Series(calc_method, index=df_weeks.index, dtype=object)
+                    df_weeks["calc_context"] = pd.Series(calc_context, index=df_weeks.index, dtype=object)
 
                     debug(context, f"[PHASES] 🔄 Propagated calc_method/context into weekly roll-up")
 
@@ -2081,88 +2235,71 @@ def build_semantic_json(context):
             # 🧭 Sort by start date for deterministic order
             df_weeks = df_weeks.sort_values("start").reset_index(drop=True)
 
-            current_phase = None
-            segment_rows = []
-
-            for _, wk in df_weeks.iterrows():
-                # fill Unclassified with previous phase if possible (prevents fragmentation)
-                if wk["phase"] == "Unclassified" and current_phase is not None:
-                    wk["phase"] = current_phase
-
-                if current_phase is None:
-                    current_phase = wk["phase"]
-                    segment_rows = [wk]
-                    continue
-
-                # 🚧 Phase change — flush previous block
-                if wk["phase"] != current_phase:
-                    seg = pd.DataFrame(segment_rows)
-                    if not seg.empty:
-                        summaries.append({
-                            "phase": current_phase,
-                            "start": seg["start"].min().strftime("%Y-%m-%d"),
-                            "end": seg["end"].max().strftime("%Y-%m-%d"),
-                            "duration_days": int((seg["end"].max() - seg["start"].min()).days) + 1,
-                            "duration_weeks": round((seg["end"].max() - seg["start"].min()).days / 7, 1),
-                            "tss_total": round(seg["tss"].sum(), 1),
-                            "hours_total": round(seg["hours"].sum(), 1),
-                            "distance_km_total": round(seg["distance_km"].sum(), 1),
-                            "descriptor": advice.get(
-                                current_phase, f"{current_phase} phase — maintain adaptive consistency."
-                            ),
-                            "calc_method": seg["calc_method"].iloc[-1] if "calc_method" in seg else None,
-                            "calc_context": (
-                                seg["calc_context"].iloc[-1]
-                                if "calc_context" in seg and not isinstance(seg["calc_context"].iloc[-1], list)
-                                else None
-                            ),
-                        })
-
-                    # start new block
-                    current_phase = wk["phase"]
-                    segment_rows = [wk]
+            # Segment runs in one NumPy pass (see _phase_runs)
+            if len(df_weeks):
+                new_run, run_phases = _phase_runs(df_weeks["phase"])
+                last_rows = np.r_[np.flatnonzero(new_run)[1:], len(new_run)] - 1
+
+                # One grouped pass over contiguous runs → every segment's bounds + totals
+                agg_df = df_weeks.groupby(np.cumsum(new_run), sort=False).agg(
+                    start=("start", "min"),
+                    end=("end", "max"),
+                    tss_total=("tss", "sum"),
+                    hours_total=("hours", "sum"),
+                    distance_km_total=("distance_km", "sum"),
+                )
+                days = (agg_df["end"] - agg_df["start"]).dt.days.tolist()
+                seg_starts = agg_df["start"].dt.strftime("%Y-%m-%d").tolist()
+                seg_ends = agg_df["end"].dt.strftime("%Y-%m-%d").tolist()
+
+                # Last week of each run carries the detection provenance
+                calc_methods = (
+                    df_weeks["calc_method"].to_numpy(dtype=object)[last_rows].tolist()
+                    if "calc_method" in df_weeks else [None] * len(last_rows)
+                )
+                if "calc_context" in df_weeks:
+                    # List-valued contexts (per-week detail) are not carried onto segments
+                    ctx_arr = df_weeks["calc_context"].to_numpy(dtype=object)[last_rows]
+                    ctx_arr[np.fromiter((isinstance(v, list) for v in ctx_arr), bool, len(ctx_arr))] = None
+                    calc_contexts = ctx_arr.tolist()
                 else:
-                    segment_rows.append(wk)
-
-            # 🧩 Flush final open segment
-            if segment_rows:
-                seg = pd.DataFrame(segment_rows)
-                summaries.append({
-                    "phase": current_phase,
-                    "start": seg["start"].min().strftime("%Y-%m-%d"),
-                    "end": seg["end"].max().strftime("%Y-%m-%d"),
-                    "duration_days": int((seg["end"].max() - seg["start"].min()).days) + 1,
-                    "duration_weeks": round((seg["end"].max() - seg["start"].min()).days / 7, 1),
-                    "tss_total": round(seg["tss"].sum(), 1),
-                    "hours_total": round(seg["hours"].sum(), 1),
-                    "distance_km_total": round(seg["distance_km"].sum(), 1),
-                    "descriptor": advice.get(
-                        current_phase, f"{current_phase} phase — maintain adaptive consistency."
-                    ),
-                    "calc_method": seg["calc_method"].iloc[-1] if "calc_method" in seg else None,
-                    "calc_context": (
-                        seg["calc_context"].iloc[-1]
-                        if "calc_context" in seg and not isinstance(seg["calc_context"].iloc[-1], list)
-                        else None
-                    ),
-                })
+                    calc_contexts = [None] * len(last_rows)
 
-            # 🔒 Mirror totals for easy debugging and validation
-            semantic["meta"]["phases_summary"] = {
-                "is_phase_block": True,
-                "phase_block_count": len(summaries),
-                "notes": "Macro-level sequential phase summary — validated and boundary-corrected.",
-            }
-
-            semantic["phases_summary"] = summaries
-
-            debug(
-                context,
-                f"[PHASES] ✅ Created {len(summaries)} macro phase blocks (merged unclassified weeks where needed)"
-            )
-
-
-            # Save to semantic
+                # Descriptors resolved once per distinct phase, then picked per run
+                #   (a missing phase reads as NaN in the weekly frame → "nan phase")
+                phase_descriptors = {
+                    p: advice.get(p, f"{'nan' if p is None else p} phase — maintain adaptive consistency.")
+                    for p in set(run_phases)
+                }
+                descriptors = [phase_descriptors[p] for p in run_phases]
+
+                for phase, seg_start, seg_end, n_days, tss_total, hours_total, dist_total, descriptor, method, ctx_val in zip(
+                    run_phases,
+                    seg_starts,
+                    seg_ends,
+                    days,
+                    agg_df["tss_total"].tolist(),
+                    agg_df["hours_total"].tolist(),
+                    agg_df["distance_km_total"].tolist(),
+                    descriptors,
+                    calc_methods,
+                    calc_contexts,
+                ):
+                    summaries.append({
+                        "phase": phase,
+                        "start": seg_start,
+                        "end": seg_end,
+                        "duration_days": int(n_days) + 1,
+                        "duration_weeks": round(n_days / 7, 1),
+                        "tss_total": round(tss_total, 1),
+                        "hours_total": round(hours_total, 1),
+                        "distance_km_total": round(dist_total, 1),
+                        "descriptor": descriptor,
+                        "calc_method": method,
+                        "calc_context": ctx_val,
+                    })
+
+            # Save to semantic (meta mirrors totals for easy debugging and validation)
             semantic["meta"]["phases_summary"] = {
                 "is_phase_block": True,
                 "phase_block_count": len(summaries),
@@ -2175,22 +2312,18 @@ def build_semantic_json(context):
             # -----------------------------------------------------
             df_weeks = df_weeks.sort_values(by=["start", "week"], ascending=[True, True]).reset_index(drop=True)
 
-            # Format + clean
-            weekly_output = (
-                df_weeks.assign(
-                    start=lambda x: pd.to_datetime(x["start"]).dt.strftime("%Y-%m-%d"),
-                    end=lambda x: pd.to_datetime(x["end"]).dt.strftime("%Y-%m-%d"),
-                    ctl=lambda x: x["ctl"].round(2),
-                    atl=lambda x: x["atl"].round(2),
-                    tsb=lambda x: x["tsb"].round(2)
-                )[
-                    [
-                        "week", "start", "end",
-                        "distance_km", "hours", "tss",
-                        "ctl", "atl", "tsb", "classification"
-                    ]
-                ].to_dict(orient="records")
-            )
+            # Format + clean (start/end are already datetime; CTL/ATL/TSB rounded as one block)
+            df_out = df_weeks[
+                [
+                    "week", "start", "end",
+                    "distance_km", "hours", "tss",
+                    "ctl", "atl", "tsb", "classification"
+                ]
+            ].copy()
+            df_out["start"] = df_out["start"].dt.strftime("%Y-%m-%d")
+            df_out["end"] = df_out["end"].dt.strftime("%Y-%m-%d")
+            df_out[["ctl", "atl", "tsb"]] = df_out[["ctl", "atl", "tsb"]].round(2)
+            weekly_output = df_out.to_dict(orient="records")
 
             semantic["phases"] = weekly_output
             debug(context, f"[PHASES] ✅ Cleaned weekly phase output ({len(weekly_output)} weeks)")
@@ -2199,21 +2332,30 @@ def build_semantic_json(context):
             # 📈 Season / Summary Trend Metrics (URF-canonical)
             # MUST run AFTER final semantic["phases"] is built
             # ---------------------------------------------------------
-            if report_type in ("season", "summary") and semantic.get("phases"):
-                df = pd.DataFrame(semantic["phases"])
-
-                def slope(series):
-                    s = pd.to_numeric(series, errors="coerce").dropna()
-                    if len(s) < 4:
-                        return "—"
-                    x = np.arange(len(s))
-                    return round(float(np.polyfit(x, s, 1)[0]), 3)
-
-                semantic["trend_metrics"] = {
-                    "load_trend": slope(df["tss"]),
-                    "fitness_trend": slope(df["ctl"]),
-                    "fatigue_trend": slope(df["atl"]),
-                }
+            # (df_out holds exactly the values just emitted — no rebuild from records)
+            if weekly_output:
+                def slopes(y):
+                    # Closed-form OLS slope per column: Σ(x-x̄)(y-ȳ) / Σ(x-x̄)²
+                    if len(y) < 4:
+                        return ["—"] * y.shape[1]
+                    xc = np.arange(len(y), dtype=np.float64) - (len(y) - 1) / 2
+                    return [round(float(b), 3) for b in xc @ (y - y.mean(axis=0)) / (xc @ xc)]
+
+                Y = (
+                    df_out[["tss", "ctl", "atl"]]
+                    .apply(pd.to_numeric, errors="coerce")
+                    .to_numpy(dtype=np.float64, na_value=np.nan)
+                )
+                nan_mask = np.isnan(Y)
+                if nan_mask.any():
+                    # Gaps shift x per column — regress each column on its own valid rows
+                    trends = [slopes(Y[~nan_mask[:, j], j:j + 1])[0] for j in range(Y.shape[1])]
+                else:
+                    trends = slopes(Y)
+
+                semantic["trend_metrics"] = dict(
+                    zip(("load_trend", "fitness_trend", "fatigue_trend"), trends)
+                )
 
                 debug(
                     context,
@@ -2224,16 +2366,10 @@ def build_semantic_json(context):
 
             # -----------------------------------------------------
             # Enforce output ordering (summary before phases)
+            # Re-inserting moves a key to the end of the dict
             # -----------------------------------------------------
-            ordered = {}
-            for k, v in semantic.items():
-                if k not in ("phases_summary", "phases"):
-                    ordered[k] = v
-            ordered["phases_summary"] = semantic["phases_summary"]
-            ordered["phases"] = semantic["phases"]
-
-            semantic.clear()
-            semantic.update(ordered)
+            semantic["phases_summary"] = semantic.pop("phases_summary")
+            semantic["phases"] = semantic.pop("phases")
 
 
     # ---------------------------------------------------------
@@ -2248,45 +2384,61 @@ def build_semantic_json(context):
 # ==============================================================
 from coaching_cheat_sheet import CLASSIFICATION_ALIASES
 
-def build_insight_view(semantic):
+# Canonical colours + aliases merged once → a single lookup per insight
+_ALIAS_MAP = {"red": "red", "amber": "amber", "green": "green", **CLASSIFICATION_ALIASES}
+
+def _iter_insights(insights: dict) -> Iterator[tuple[str, str, dict]]:
+    """
+    Single pass over insights → (name, classification, insight) for the view.
+    Contextual-confidence and unclassified insights are skipped inline; the
+    classification is read once and handed on with the insight.
+    """
+    for name, ins in insights.items():
+        if ins.get("metric_confidence", "high") == "contextual":
+            continue
+        cls = ins.get("classification")
+        if not cls:
+            continue
+        yield name, cls, ins
+
+
+def _clear_insight_view() -> dict:
+    return {
+        "state": "clear",
+        "message": "No items require immediate attention at this time.",
+        "critical": [],
+        "watch": [],
+        "positive": [],
+    }
+
+
+def build_insight_view(semantic: dict) -> dict:
     insights = semantic.get("insights", {})
 
-    critical, watch, positive = [], [], []
+    # Nothing classified yet (e.g. early or wellness-light reports)
+    if not insights:
+        return _clear_insight_view()
 
-    for key, ins in insights.items():
-        cls = ins.get("classification")
-        confidence = ins.get("metric_confidence", "high")
+    critical, watch, positive = [], [], []
 
-        if confidence == "contextual":
-            continue
+    # Local bindings for the per-insight hot path; color → bucket append
+    resolve_color = _ALIAS_MAP.get
+    buckets = {"red": critical.append, "amber": watch.append, "green": positive.append}
 
-        if not cls:
+    for key, cls, ins in _iter_insights(insights):
+        add = buckets.get(resolve_color(cls))
+        if add is None:
             continue
 
-        color = CLASSIFICATION_ALIASES.get(cls, cls)
-
-        entry = {
+        add({
             "name": key,
             "classification": cls,
             "interpretation": ins.get("interpretation"),
             "coaching_implication": ins.get("coaching_implication"),
-        }
-
-        if color == "red":
-            critical.append(entry)
-        elif color == "amber":
-            watch.append(entry)
-        elif color == "green":
-            positive.append(entry)
+        })
 
     if not (critical or watch or positive):
-        return {
-            "state": "clear",
-            "message": "No items require immediate attention at this time.",
-            "critical": [],
-            "watch": [],
-            "positive": [],
-        }
+        return _clear_insight_view()
 
     return {
         "critical": critical,
@@ -2297,6 +2449,26 @@ def build_insight_view(semantic):
 
 
 
+@lru_cache(maxsize=16)
+def _report_contract(report_type: str):
+    """
+    Static contract pieces for a report type:
+    (report_header, resolution, allowed_keys, renderer_instructions).
+
+    Depends only on module-level config (REPORT_HEADERS / REPORT_RESOLUTION /
+    REPORT_CONTRACT / RENDERER_PROFILES), so it is built once per report type.
+    allowed_keys is None when the report type has no contract.
+    """
+    header = REPORT_HEADERS.get(report_type, {})
+    contract = REPORT_CONTRACT.get(report_type)
+    return (
+        header,
+        REPORT_RESOLUTION.get(report_type, {}),
+        frozenset(contract) if contract is not None else None,
+        build_system_prompt_from_header(report_type, header),
+    )
+
+
 def apply_report_type_contract(semantic: dict) -> dict:
     """
     Enforce report-type-specific semantic exposure (URF v5.1).
@@ -2310,26 +2482,26 @@ def apply_report_type_contract(semantic: dict) -> dict:
       at the ChatGPT call site.
     """
     report_type = semantic.get("meta", {}).get("report_type", "weekly")
+    header, resolution, allowed_set, prompt = _report_contract(report_type)
 
     # --- Enrich meta with header + resolution
-    semantic["meta"]["report_header"] = REPORT_HEADERS.get(report_type, {})
-    semantic["meta"]["resolution"] = REPORT_RESOLUTION.get(report_type, {})
+    semantic["meta"]["report_header"] = header
+    semantic["meta"]["resolution"] = resolution
     semantic["header"] = semantic["meta"]["report_header"]
 
-    # --- Apply contract filtering
-    allowed_keys = REPORT_CONTRACT.get(report_type, semantic.keys())
-    filtered = {k: v for k, v in semantic.items() if k in allowed_keys}
+    # --- Apply contract filtering (allowed_set is a frozenset; no contract keeps everything)
+    if allowed_set is None:
+        filtered = dict(semantic)
+        unexpected = []
+    else:
+        filtered = {k: v for k, v in semantic.items() if k in allowed_set}
+        unexpected = [k for k in semantic if k not in allowed_set]
 
     # --- Attach renderer instructions (DATA ONLY)
-    filtered["renderer_instructions"] = build_system_prompt_from_header(
-        report_type,
-        REPORT_HEADERS.get(report_type, {})
-    )
+    filtered["renderer_instructions"] = prompt
 
     # --- Optional contract drift detection
-    unexpected = set(semantic.keys()) - set(allowed_keys)
     if unexpected:
-        from audit_core.utils import debug
         debug(
             {},
             f"[CONTRACT] ⚠️ Unexpected keys in '{report_type}' report: {unexpected}"
@@ -2337,6 +2509,64 @@ def apply_report_type_contract(semantic: dict) -> dict:
 
     return filtered
 
+# Numbered section manifests per report type — REPORT_CONTRACT is static.
+# Dict contracts contribute their keys; empty contracts use the default order.
+def _number_sections(sections) -> str:
+    return "\n".join(f"{i}. {section}" for i, section in enumerate(sections, start=1))
+
+_DEFAULT_SECTION_MANIFEST = _number_sections(("Summary", "Metrics", "Actions"))
+_SECTION_MANIFESTS = {
+    rt: _number_sections(sections) if sections else _DEFAULT_SECTION_MANIFEST
+    for rt, sections in REPORT_CONTRACT.items()
+}
+
+# Built once at import; filled per call with str.format_map.
+# The 4-space margin is part of the rendered prompt (the multi-line rule
+# lists substituted in start at column 0, so dedent never removed it);
+# only lines left whitespace-only by an empty block are blanked, as dedent did.
+_WHITESPACE_ONLY_LINE = re.compile(r"^[ \t]+$", re.MULTILINE)
+_RENDERER_PROMPT_TEMPLATE = """
+    You are a deterministic URF renderer.
+
+    You must render a **{title}** using the embedded system context.
+    This report follows the **Unified Reporting Framework ({contract_version})**.
+
+    **Scope:** {scope}
+    **Data Sources:** {sources}
+    **Intended Use:** {intended}
+
+    HARD RULES:
+    {hard_rules}
+
+    INTERPRETATION RULES:
+    {interpretation_rules}
+
+    {coaching_block}
+
+    {enrichment_block}
+
+    {state_presentation_block}
+
+    {emphasis_block}
+
+    {framing_block}
+
+    {section_handling_block}
+
+    LIST RENDERING RULES (NON-NEGOTIABLE):
+    {list_rules}
+
+    TONE AND STYLE:
+    {tone_rules}
+
+    SECTION ORDER (INSTRUCTIONAL — DO NOT NUMBER HEADERS):
+    {manifest}
+
+    End with a factual closing note on recovery or adaptation
+    based strictly on the provided data.
+    """.strip()
+
+
 def build_system_prompt_from_header(report_type: str, header: dict) -> str:
     """
     Build deterministic renderer instructions for GPT based on the
@@ -2345,25 +2575,16 @@ def build_system_prompt_from_header(report_type: str, header: dict) -> str:
     This output is DATA ONLY and must be used as a system-role message
     by the caller.
     """
-    from coaching_profile import RENDERER_PROFILES
-    from textwrap import dedent
-
     title = header.get("title", f"{report_type.title()} Report")
     scope = header.get("scope", "Training and wellness summary")
     sources = header.get("data_sources", "Intervals.icu activity and wellness datasets")
     intended = header.get("intended_use", "General endurance coaching insight")
-    contract_sections = REPORT_CONTRACT.get(report_type, [])
     contract_version = "URF v5.1"
 
     # --------------------------------------------------
-    # Resolve section order from contract
+    # Section order from contract (pre-numbered at import)
     # --------------------------------------------------
-    if isinstance(contract_sections, dict):
-        section_order = list(contract_sections.keys())
-    else:
-        section_order = contract_sections or ["Summary", "Metrics", "Actions"]
-
-    manifest_lines = [f"{i}. {section}" for i, section in enumerate(section_order, start=1)]
+    manifest = _SECTION_MANIFESTS.get(report_type, _DEFAULT_SECTION_MANIFEST)
 
     # --------------------------------------------------
     # Resolve renderer profiles
@@ -2405,16 +2626,18 @@ def build_system_prompt_from_header(report_type: str, header: dict) -> str:
 
     enrichment_block = ""
     if allowed_enrichment:
+        enrichment_lines = "\n".join(f"- {r}" for r in allowed_enrichment)
         enrichment_block = dedent(f"""
         ALLOWED ENRICHMENT:
-        {chr(10).join(f"- {r}" for r in allowed_enrichment)}
+        {enrichment_lines}
         """).strip()
 
     section_handling_block = ""
     if section_handling:
+        section_handling_lines = "\n".join(f"- {k}: {v}" for k, v in section_handling.items())
         section_handling_block = dedent(f"""
         SECTION HANDLING RULES:
-        {chr(10).join(f"- {k}: {v}" for k, v in section_handling.items())}
+        {section_handling_lines}
 
         Handling meanings:
         - full: render entire section exactly as provided
@@ -2454,11 +2677,12 @@ def build_system_prompt_from_header(report_type: str, header: dict) -> str:
 
     emphasis_block = ""
     if emphasis:
+        emphasis_lines = "\n".join(f"- {k}: {v}" for k, v in emphasis.items())
         emphasis_block = dedent(f"""
         EMPHASIS GUIDANCE:
         The following sections should receive proportional narrative and visual emphasis.
         This does NOT change section order, inclusion, or data fidelity.
-        {chr(10).join(f"- {k}: {v}" for k, v in emphasis.items())}
+        {emphasis_lines}
         """).strip()
 
     framing_block = ""
@@ -2473,46 +2697,24 @@ def build_system_prompt_from_header(report_type: str, header: dict) -> str:
     # --------------------------------------------------
     # Assemble final prompt
     # --------------------------------------------------
-    prompt = dedent(f"""
-    You are a deterministic URF renderer.
-
-    You must render a **{title}** using the embedded system context.
-    This report follows the **Unified Reporting Framework ({contract_version})**.
-
-    **Scope:** {scope}
-    **Data Sources:** {sources}
-    **Intended Use:** {intended}
-
-    HARD RULES:
-    {chr(10).join(f"- {r}" for r in hard_rules)}
-
-    INTERPRETATION RULES:
-    {chr(10).join(f"- {r}" for r in interpretation_rules)}
-
-    {coaching_block}
-
-    {enrichment_block}
-
-    {state_presentation_block}
-
-    {emphasis_block}
-
-    {framing_block}
-
-    {section_handling_block}
-
-    LIST RENDERING RULES (NON-NEGOTIABLE):
-    {chr(10).join(f"- {r}" for r in list_rules)}
-
-    TONE AND STYLE:
-    {chr(10).join(f"- {r}" for r in tone_rules)}
-
-    SECTION ORDER (INSTRUCTIONAL — DO NOT NUMBER HEADERS):
-    {chr(10).join(manifest_lines)}
-
-    End with a factual closing note on recovery or adaptation
-    based strictly on the provided data.
-    """).strip()
+    prompt = _WHITESPACE_ONLY_LINE.sub("", _RENDERER_PROMPT_TEMPLATE.format_map({
+        "title": title,
+        "contract_version": contract_version,
+        "scope": scope,
+        "sources": sources,
+        "intended": intended,
+        "hard_rules": "\n".join(f"- {r}" for r in hard_rules),
+        "interpretation_rules": "\n".join(f"- {r}" for r in interpretation_rules),
+        "coaching_block": coaching_block,
+        "enrichment_block": enrichment_block,
+        "state_presentation_block": state_presentation_block,
+        "emphasis_block": emphasis_block,
+        "framing_block": framing_block,
+        "section_handling_block": section_handling_block,
+        "list_rules": "\n".join(f"- {r}" for r in list_rules),
+        "tone_rules": "\n".join(f"- {r}" for r in tone_rules),
+        "manifest": manifest,
+    }))
 
     return prompt
 
@@ -0,0 +1,35 @@
+"""
+Regression checks for semantic_json_builder helpers.
+Run with: python -m pytest test_harness.py
+"""
+
+import pandas as pd
+
+from semantic_json_builder import _phase_runs
+
+
+def test_phase_runs_merges_unclassified_into_preceding_phase():
+    new_run, run_phases = _phase_runs(pd.Series(["Base", "Base", "Unclassified", "Build"]))
+    assert new_run.tolist() == [True, False, False, True]
+    assert run_phases == ["Base", "Build"]
+
+
+def test_phase_runs_missing_phase_is_its_own_run():
+    # A missing phase must not decode as the last category (code -1)
+    new_run, run_phases = _phase_runs(pd.Series(["Build", None]))
+    assert new_run.tolist() == [True, True]
+    assert run_phases == ["Build", None]
+
+
+def test_phase_runs_missing_phases_never_merge():
+    # NaN never equals NaN: each missing week (and an Unclassified week
+    # inheriting it) starts a new run, as the row-by-row roll-up did
+    new_run, run_phases = _phase_runs(pd.Series([None, float("nan"), "Unclassified", "Build"]))
+    assert new_run.tolist() == [True, True, True, True]
+    assert run_phases == [None, None, None, "Build"]
+
+
+def test_phase_runs_empty():
+    new_run, run_phases = _phase_runs(pd.Series([], dtype=object))
+    assert new_run.tolist() == []
+    assert run_phases == []